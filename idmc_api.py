@@ -1,5 +1,11 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import os
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # ============================================================================
 # CONFIGURATION - Adjust these settings
@@ -12,6 +18,120 @@ verboseSearchFlag = False  # Set to True to see progressive query execution deta
 # Default is 10000 (Elasticsearch limit). Lower values will trigger more aggressive splitting.
 # For testing, set to 100 or lower to see the progressive splitting in action.
 PROGRESSIVE_QUERY_LIMIT = 10000
+# Plan the split points from "filters" aggregation counts (one or two requests per asset type)
+# instead of one count probe per range. Probing is still used if aggregations aren't returned.
+PROGRESSIVE_USE_AGGREGATIONS = True
+# Characters used to pick split boundaries, in ascending (code point) order. Names are split one
+# character deeper at a time, so any prefix - digits and underscores included - can be split.
+PROGRESSIVE_SPLIT_ALPHABET = "-.0123456789_abcdefghijklmnopqrstuvwxyz"
+PROGRESSIVE_MAX_SPLIT_DEPTH = 8
+
+# Relationship Pushdown Settings
+# Only the relationships the writer links are fetched: parent/child associations (hierarchy and
+# policy rollup) and the glossary/classification relationship types. They are partitioned by exact
+# type from a "terms" aggregation, and a type too large for one query is split on
+# core.sourceIdentity ranges (RELATIONSHIP_SPLIT_ALPHABET, ordered). Set RELATIONSHIP_PUSHDOWN to
+# False to fetch every relationship of the origin, split with type-name wildcards.
+RELATIONSHIP_PUSHDOWN = True
+RELATIONSHIP_ASSOCIATION_KINDS = ["core.ParentChild"]
+RELATIONSHIP_TYPES = ["com.infa.ccgf.models.governance.IClassTechnicalGlossaryBase", "core.ClassifiedAs"]
+RELATIONSHIP_TYPE_BUCKETS = 500
+RELATIONSHIP_SPLIT_ALPHABET = "-0123456789abcdef"
+
+# Query Plan Cache Settings
+# When set to a file path, each origin's query plan (chunks and their counts) is saved there and
+# reused on the next run. All chunk counts are re-verified in a single request, and only chunks that
+# drifted by more than QUERY_PLAN_DRIFT_THRESHOLD (fraction) and no longer fit are split again.
+# Plans older than QUERY_PLAN_CACHE_MAX_AGE_DAYS, or built with a different limit, relationship pushdown
+# (RELATIONSHIP_PUSHDOWN, RELATIONSHIP_TYPES, RELATIONSHIP_ASSOCIATION_KINDS) or SOURCE_FIELDS, are rebuilt from scratch.
+QUERY_PLAN_CACHE_FILE = None
+QUERY_PLAN_DRIFT_THRESHOLD = 0.1
+QUERY_PLAN_CACHE_MAX_AGE_DAYS = 30
+
+# Incremental Sync Settings
+# When set to a file path, fetchObjectsIncremental saves each origin's objects, hierarchy and
+# glossary/classification links there, with watermarks: the highest value of each WATERMARK_FIELDS
+# field over the origin when it was fetched. The next run only searches for the objects and
+# relationships where any of these fields is at or after its watermark, and applies them to the
+# saved state. The last-modified time comes first: curating a relationship (accepting or rejecting
+# a classification or term) updates it but isn't a scan. scannedTime catches rescanned assets. A
+# field the tenant doesn't populate gets no watermark and is ignored; change the names here if your
+# tenant uses different ones. Changed relationships are fetched whatever their curation status, so a
+# link that is no longer ACCEPTED is removed.
+# WATERMARK_OVERLAP (in the fields' units, epoch milliseconds) is subtracted from each watermark, so
+# documents indexed late by a scan that was still running when the watermark was taken are seen.
+# Deleted assets aren't detected, so states whose last full fetch is older than
+# CATALOG_STATE_MAX_AGE_DAYS are rebuilt from scratch.
+CATALOG_STATE_FILE = None
+WATERMARK_FIELDS = ["core.lastModifiedTime", "com.infa.ccgf.models.governance.scannedTime"]
+WATERMARK_OVERLAP = 6 * 3600 * 1000
+CATALOG_STATE_MAX_AGE_DAYS = 7
+
+# HTTP Settings
+# All IDMC calls share one pooled, keep-alive HTTP session per INFASession. HTTP_POOL_SIZE is also
+# the most requests a session has in flight at once: the worker settings below (SEARCH_WORKERS,
+# BOOTSTRAP_WORKERS, ID_LOOKUP_WORKERS) only decide how work is spread out, and their threads
+# share HTTP_POOL_SIZE request slots, however they are nested.
+# Timeouts are in seconds; a call that exceeds them raises instead of hanging the run.
+HTTP_POOL_SIZE = 16
+HTTP_CONNECT_TIMEOUT = 10
+HTTP_READ_TIMEOUT = 300
+
+# Pagination Settings
+# "search_after" pages through results with sort-key cursors, which has no 10,000 result window
+# and doesn't slow down on deep pages. "offset" uses from/size. Offset paging is also used
+# automatically whenever a cursor can't be obtained from the response.
+SEARCH_PAGINATION_MODE = "search_after"
+SEARCH_PAGE_SIZE = 1000
+# Appended to every search_after sort so that documents with equal sort values are never skipped.
+# These must be keyword (exact value) fields: core.identity is looked up with exact "term" filters,
+# the relationship identities hold the same UUIDs, and type is filtered and aggregated on (it separates
+# two relationships of different types between the same objects). If the server rejects the sort (or
+# returns no cursors), the session switches to offset paging once and keeps using it for every later search.
+SEARCH_AFTER_TIEBREAKERS = ["core.identity", "core.sourceIdentity", "core.targetIdentity", "type"]
+# Once the first page has reported totalHits, the remaining pages of a query (when they fit in
+# the from/size window) and the independent queries of a plan are fetched with up to this many
+# parallel requests. Results are always returned in query/page order. Set to 1 to fetch serially.
+SEARCH_WORKERS = 4
+SEARCH_OFFSET_WINDOW = 10000
+# Count probes of leaf-sized queries (one asset type, one name or relationship range) also ask for
+# the first page of hits. When a query fits in that page, the probe's hits are kept and reused, so the
+# query isn't sent a second time to fetch them. Probes of queries expected to be split (all of an
+# origin's objects or relationships) only count. 0 = count only.
+PROBE_PAGE_SIZE = 1000
+
+# Field Projection Settings
+# Every search asks only for the sourceAsMap fields the object model reads, instead of every
+# custom attribute of every asset. Add any other field you need in raw maps to EXTRA_SOURCE_FIELDS.
+# The projection is added where each search's query dict is built (with_source_filter); a query that
+# sets its own "_source" is left alone. Set SOURCE_FIELDS to None to fetch everything.
+SOURCE_FIELDS = [
+    "core.identity", "core.name", "core.description", "core.origin", "core.externalId",
+    "core.classType", "core.location", "type", "elementType",
+    "core.sourceIdentity", "core.targetIdentity", "core.sourceOrigin", "core.targetOrigin",
+    "core.associationKind", "core.curationStatus",
+    "com.infa.ccgf.models.governance.scannedTime",
+]
+EXTRA_SOURCE_FIELDS = []
+
+# Object Model Settings
+# Catalog objects keep only the fields they use (plus EXTRA_SOURCE_FIELDS, readable through
+# getvalue()) and drop the rest of their sourceAsMap. Set KEEP_RAW_MAPS to True to keep the whole
+# map in obj.map, at the cost of a lot more memory on large resources.
+KEEP_RAW_MAPS = False
+
+# Session Bootstrap Settings
+# The policy, resource, classification and business term searches (and the policy relationship
+# searches) made when a session is created run with up to this many in parallel. 1 = one at a time.
+# Collections that aren't preloaded (see INFASession preload) are loaded on first access instead.
+BOOTSTRAP_WORKERS = 4
+SESSION_COLLECTIONS = ["policies", "resources", "classifications", "businessterms"]
+
+# Remote Identity Lookup Settings
+# Identities that aren't loaded yet are fetched with "terms" queries of this many IDs,
+# using up to ID_LOOKUP_WORKERS parallel requests.
+ID_LOOKUP_BATCH_SIZE = 500
+ID_LOOKUP_WORKERS = 4
 
 idmc_api_version = 20251214
 default_infa_url_base = "https://dm-us.informaticacloud.com"
@@ -27,11 +147,17 @@ OBJECTS Strategy:
 1. Try whole resource
 2. If hits limit → split by elementType (OBJECT vs RELATIONSHIP)
 3. If OBJECT hits limit → split by asset type (Table, View, Column, etc.)
-4. If asset type hits limit → split alphabetically (<a, a-f, f-k, k-p, p-u, u+)
-5. If alphabetic range hits limit → split by single letter (<a, a-b, b-c, ..., z+)
-6. If single letter hits limit → split by two letters (aa-af, af-ak, ak-ap, ap-au, au-ba)
+4. If asset type hits limit → split the name range one character deeper (<-, --., ..0, ..., z+)
+   using the counts actually observed for each sub-range
+5. Any sub-range still over the limit is split one more character deeper (e.g. dim_ → dim_0..dim_z),
+   recursively, then adjacent sub-ranges are merged back together while they fit under the limit
 
-RELATIONSHIPS Strategy:
+RELATIONSHIPS Strategy (RELATIONSHIP_PUSHDOWN):
+1. Only relationships with a consumed association kind or type (parent/child, glossary, classification)
+2. Count them per exact type with a "terms" aggregation; pack whole types into chunks under the limit
+3. A type over the limit is split on core.sourceIdentity ranges, one hex character deeper at a time
+
+RELATIONSHIPS Strategy (without pushdown):
 1. Try all relationships
 2. If hits limit → split alphabetically using wildcards (a-f, f-k, k-p, p-u, u+)
    - Uses wildcards: *.a*, *.A*, *.b*, *.B*, etc.
@@ -79,6 +205,35 @@ def add_element_type_filter(query, element_type):
     )
     return query
 
+def relationship_pushdown_filter():
+    """Clause matching the relationships the writer uses, or None when pushdown is off"""
+    if not RELATIONSHIP_PUSHDOWN:
+        return None
+    return {
+        "bool": {
+            "should": [
+                {"terms": {"core.associationKind": list(RELATIONSHIP_ASSOCIATION_KINDS)}},
+                {"terms": {"type": list(RELATIONSHIP_TYPES)}}
+            ],
+            "minimum_should_match": 1
+        }
+    }
+
+def add_relationship_pushdown_filter(query):
+    """Add the relationship pushdown filter (if enabled)"""
+    pushdown_filter = relationship_pushdown_filter()
+    if pushdown_filter is not None:
+        query["query"]["bool"]["filter"].append(pushdown_filter)
+    return query
+
+def relationship_clause():
+    """Clause matching every relationship the plan fetches"""
+    clauses = [{"term": {"elementType": "RELATIONSHIP"}}]
+    pushdown_filter = relationship_pushdown_filter()
+    if pushdown_filter is not None:
+        clauses.append(pushdown_filter)
+    return {"bool": {"filter": clauses}}
+
 def add_type_filter(query, asset_type):
     """Add specific asset type filter"""
     query["query"]["bool"]["filter"].append(
@@ -136,30 +291,114 @@ def add_relationship_wildcard_filter(query, start, end):
     
     return query
 
-def add_range_filter(query, start, end):
-    """Add alphabetic range filter - uses core.name (without .keyword which doesn't exist in this ES)"""
-    # Note: Using core.name may cause duplicates with multi-word names due to tokenization
-    # Deduplication is handled in Python after fetching results
-    
+def build_range_filter(start, end, field="core.name"):
+    """Build the alphabetic range clause on field (core.name by default), or None for an unbounded range"""
     if start is None and end:
         # Special range: anything less than 'a' (numbers, underscore, etc.)
-        range_filter = {"range": {"core.name": {"lt": end.lower()}}}
+        return {"range": {field: {"lt": end.lower()}}}
     elif start and end:
         # Normal range: start to end
-        range_filter = {"range": {"core.name": {"gte": start.lower(), "lt": end.lower()}}}
+        return {"range": {field: {"gte": start.lower(), "lt": end.lower()}}}
     elif start and not end:
         # Last range: everything >= start
-        range_filter = {"range": {"core.name": {"gte": start.lower()}}}
+        return {"range": {field: {"gte": start.lower()}}}
     else:
         # Both None - shouldn't happen
+        return None
+
+def split_name_range(start, end, alphabet=None):
+    """
+    Split [start, end) into contiguous sub-ranges one character deeper than the bounds
+    (None = unbounded). The sub-ranges always cover the whole original range.
+    Returns an empty list if the range can't be split any further.
+    """
+    if alphabet is None:
+        alphabet = PROGRESSIVE_SPLIT_ALPHABET
+    low = start or ""
+    high = end or ""
+    prefix_length = 0
+    while prefix_length < min(len(low), len(high)) and low[prefix_length] == high[prefix_length]:
+        prefix_length += 1
+
+    points = set()
+    if len(low) == prefix_length:
+        points.update(low + c for c in alphabet)
+    # Step up from the lower bound one character position at a time (dim_3, dim_4, ..., dima, ..., e)
+    for i in range(len(low) - 1, prefix_length - 1, -1):
+        points.update(low[:i] + c for c in alphabet if c > low[i])
+    # ... and down towards the upper bound (f, f0, ..., fn, fo, fo0, ...)
+    if end is not None:
+        for i in range(prefix_length + 1, len(end)):
+            points.update(end[:i] + c for c in alphabet if c <= end[i])
+    points = sorted(p for p in points if p > low and (end is None or p < end))
+
+    if len(points) == 0:
+        # Nothing fits between the bounds at this depth, e.g. [a, b) - extend the lower bound instead
+        points = [low + c for c in alphabet if end is None or low + c < end]
+    if len(points) == 0:
+        return []
+
+    bounds = [start] + points + [end]
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+def add_range_filter(query, start, end):
+    """Add alphabetic range filter - uses core.name (without .keyword which doesn't exist in this ES)"""
+    # Note: Using core.name may cause duplicates with multi-word names due to tokenization
+    # Deduplication is handled in Python after fetching results
+    range_filter = build_range_filter(start, end)
+    if range_filter is None:
         return query
     
     query["query"]["bool"]["filter"].append(range_filter)
     return query
 
-def test_query(session, query_dict, limit=10000, description="Query"):
-    """Test if query exceeds limit"""
+def source_filter():
+    """The "_source" include list sent with every search, or None to return whole documents"""
+    if SOURCE_FIELDS is None:
+        return None
+    return list(dict.fromkeys(list(SOURCE_FIELDS) + list(EXTRA_SOURCE_FIELDS)))
+
+def with_source_filter(query_dict):
+    """Copy of query_dict restricted to the projected fields, unless it already sets _source"""
+    includes = source_filter()
+    if includes is None or '_source' in query_dict:
+        return query_dict
+    query_dict = dict(query_dict)
+    query_dict['_source'] = {"includes": includes}
+    return query_dict
+
+def intern_value(value):
+    """Intern a string field value (names and types repeat across many objects)"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+def sort_with_tiebreakers(sort):
+    """Copy of a sort list with SEARCH_AFTER_TIEBREAKERS appended, so search_after never skips equal keys"""
+    sort = list(sort)
+    sorted_fields = set()
+    for sort_entry in sort:
+        if isinstance(sort_entry, dict):
+            sorted_fields.update(sort_entry.keys())
+        else:
+            sorted_fields.add(sort_entry)
+    for field in SEARCH_AFTER_TIEBREAKERS:
+        if field not in sorted_fields:
+            sort.append({field: {"order": "asc", "unmapped_type": "keyword"}})
+    return sort
+
+def first_page_if_complete(response, total):
+    """The hits of a response if they are the query's complete result, else None"""
+    hits = response.get('hits', {}).get('hits') or []
+    if total > 0 and len(hits) >= total:
+        return hits
+    return None
+
+def test_query(session, query_dict, limit=10000, description="Query", page_size=None):
+    """Test if query exceeds limit (also fetching the first page_size hits, default PROBE_PAGE_SIZE)"""
     import json
+    if page_size is None:
+        page_size = PROBE_PAGE_SIZE
     query_json = json.dumps(query_dict, indent=2)
     
     # Log the query for debugging
@@ -168,7 +407,10 @@ def test_query(session, query_dict, limit=10000, description="Query"):
         print(query_json)
         print("---")
     
-    result = session.DG_elastic_search(query_json)
+    probe_dict = dict(with_source_filter(query_dict))
+    probe_dict['from'] = 0
+    probe_dict['size'] = page_size
+    result = session.DG_elastic_search(json.dumps(probe_dict))
     total = result.get('hits', {}).get('totalHits', 0)
     exceeds_limit = total >= limit
     
@@ -177,9 +419,223 @@ def test_query(session, query_dict, limit=10000, description="Query"):
         'exceeds_limit': exceeds_limit,
         'query': query_dict,
         'description': description,
-        'query_json': query_json  # Include for inspection
+        'query_json': query_json,  # Include for inspection
+        'results': first_page_if_complete(result, total)  # Reused by fetchObjects when not None
+    }
+
+def planned_query(query_dict, total, limit=10000, description="Query", split=None):
+    """Plan entry for a query whose count is already known (same shape as test_query results)"""
+    return {
+        'total': total,
+        'exceeds_limit': total >= limit,
+        'query': query_dict,
+        'description': description,
+        'query_json': json.dumps(query_dict, indent=2),
+        'split': split
+    }
+
+def query_plan_settings():
+    """Settings a cached plan was built with: the relationship pushdown filter and the _source fields"""
+    return {
+        'relationship_pushdown': relationship_pushdown_filter(),
+        'source_fields': source_filter()
+    }
+
+def load_cached_query_plan(origin, limit):
+    """Cached plan for origin, or None if there is no usable one"""
+    if not QUERY_PLAN_CACHE_FILE or not os.path.exists(QUERY_PLAN_CACHE_FILE):
+        return None
+    try:
+        with open(QUERY_PLAN_CACHE_FILE, "r") as cache_file:
+            plan = json.load(cache_file).get(origin)
+    except (OSError, ValueError):
+        return None
+    if plan is None or plan.get('limit') != limit or plan.get('version') != idmc_api_version:
+        return None
+    if plan.get('settings') != query_plan_settings():
+        return None
+    if time.time() - plan.get('timestamp', 0) > QUERY_PLAN_CACHE_MAX_AGE_DAYS * 86400:
+        return None
+    return plan
+
+def save_cached_query_plan(origin, limit, queries, asset_type_counts, relationship_total):
+    if not QUERY_PLAN_CACHE_FILE:
+        return
+    cache = {}
+    try:
+        with open(QUERY_PLAN_CACHE_FILE, "r") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        pass
+    cache[origin] = {
+        'version': idmc_api_version,
+        'timestamp': time.time(),
+        'limit': limit,
+        'settings': query_plan_settings(),
+        'asset_type_counts': asset_type_counts,
+        'relationship_total': relationship_total,
+        'queries': [{'description': q['description'], 'total': q['total'], 'query': q['query'], 'split': q.get('split')}
+                    for q in queries]
+    }
+    try:
+        temp_file = QUERY_PLAN_CACHE_FILE + ".tmp"
+        with open(temp_file, "w") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(temp_file, QUERY_PLAN_CACHE_FILE)
+    except OSError as e:
+        print(f"WARNING: Could not save query plan cache {QUERY_PLAN_CACHE_FILE}: {e}")
+
+def load_catalog_state(origin):
+    """Saved catalog state for origin, or None if there is no usable one"""
+    if not CATALOG_STATE_FILE or not os.path.exists(CATALOG_STATE_FILE):
+        return None
+    try:
+        with open(CATALOG_STATE_FILE, "r") as state_file:
+            state = json.load(state_file).get(origin)
+    except (OSError, ValueError):
+        return None
+    if state is None or state.get('version') != idmc_api_version or not state.get('watermark'):
+        return None
+    if 'linked_glossary' not in state:
+        return None
+    if time.time() - state.get('full_fetch_timestamp', 0) > CATALOG_STATE_MAX_AGE_DAYS * 86400:
+        return None
+    return state
+
+def save_catalog_state(origin, state):
+    if not CATALOG_STATE_FILE:
+        return
+    states = {}
+    try:
+        with open(CATALOG_STATE_FILE, "r") as state_file:
+            states = json.load(state_file)
+    except (OSError, ValueError):
+        pass
+    states[origin] = state
+    try:
+        temp_file = CATALOG_STATE_FILE + ".tmp"
+        with open(temp_file, "w") as state_file:
+            json.dump(states, state_file)
+        os.replace(temp_file, CATALOG_STATE_FILE)
+    except OSError as e:
+        print(f"WARNING: Could not save catalog state {CATALOG_STATE_FILE}: {e}")
+
+def catalog_state(watermark, full_fetch_timestamp, objects, children, links, linked_glossary):
+    """
+    Catalog state of one origin, as saved by save_catalog_state.
+
+    Args:
+        watermark: {field: highest value already applied} for the WATERMARK_FIELDS the origin has
+        full_fetch_timestamp: time.time() of the last full fetch the state was built from
+        objects: {identity: fields to rebuild the INFA_DG_Object} (see INFA_DG_Object.stateMap)
+        children: {parent identity: [child identity]} (parent/child relationships)
+        links: {source identity: [target identity]} (accepted glossary/classification relationships)
+        linked_glossary: {linked classification/term identity: [name, sorted parent policy names]}
+    """
+    return {
+        'version': idmc_api_version,
+        'timestamp': time.time(),
+        'full_fetch_timestamp': full_fetch_timestamp,
+        'watermark': watermark,
+        'objects': objects,
+        'children': children,
+        'links': links,
+        'linked_glossary': linked_glossary
+    }
+
+def origin_clause(origin):
+    """Clause matching the objects and relationships of an origin, and the relationships that touch it"""
+    return {
+        "bool": {
+            "should": [
+                {"term": {"core.origin": origin}},
+                {"term": {"core.sourceOrigin": origin}},
+                {"term": {"core.targetOrigin": origin}}
+            ],
+            "minimum_should_match": 1
+        }
+    }
+
+def changed_since_query(clauses, since):
+    """Query for the documents matching every clause with any since field ({field: value}) at or after its value, oldest first"""
+    return {
+        "query": {
+            "bool": {
+                "filter": list(clauses) + [{
+                    "bool": {
+                        "should": [{"range": {field: {"gte": value}}} for field, value in since.items()],
+                        "minimum_should_match": 1
+                    }
+                }]
+            }
+        },
+        "sort": [
+            {field: {"order": "asc", "unmapped_type": "long"}} for field in since
+        ]
     }
 
+def count_with_aggregation(session, query_dict, named_filters, page_size=0):
+    """
+    Count several sub-filters of a query in a single request using a "filters" aggregation.
+
+    Returns:
+        (total hits of query_dict, {name: count}, complete hits or None) or None if the search
+        endpoint doesn't return the aggregation. Hits are only requested when page_size > 0.
+    """
+    import copy
+    agg_query = copy.deepcopy(query_dict)
+    agg_query['from'] = 0
+    agg_query['size'] = page_size
+    agg_query['aggs'] = {"split_counts": {"filters": {"filters": named_filters}}}
+
+    try:
+        result = session.DG_elastic_search(json.dumps(with_source_filter(agg_query)))
+        aggregations = result['aggregations']
+        # Some endpoints return typed keys, e.g. "filters#split_counts"
+        split_counts = None
+        for key, value in aggregations.items():
+            if key == 'split_counts' or key.endswith('#split_counts'):
+                split_counts = value
+        counts = {name: bucket['doc_count'] for name, bucket in split_counts['buckets'].items()}
+        total = result['hits']['totalHits']
+    except Exception:
+        return None
+
+    if set(counts) != set(named_filters):
+        return None
+    return total, counts, first_page_if_complete(result, total)
+
+def count_by_terms(session, query_dict, field, size=100, page_size=0):
+    """
+    Count the values of field within a query in a single request using a "terms" aggregation.
+
+    Returns:
+        (total hits of query_dict, {value: count}, count of documents in values beyond size,
+        complete hits or None) or None if the search endpoint doesn't return the aggregation
+    """
+    import copy
+    agg_query = copy.deepcopy(query_dict)
+    agg_query['from'] = 0
+    agg_query['size'] = page_size
+    agg_query['aggs'] = {"term_counts": {"terms": {"field": field, "size": size}}}
+
+    try:
+        result = session.DG_elastic_search(json.dumps(with_source_filter(agg_query)))
+        aggregations = result['aggregations']
+        # Some endpoints return typed keys, e.g. "sterms#term_counts"
+        term_counts = None
+        for key, value in aggregations.items():
+            if key == 'term_counts' or key.endswith('#term_counts'):
+                term_counts = value
+        counts = {bucket['key']: bucket['doc_count'] for bucket in term_counts['buckets']}
+        total = result['hits']['totalHits']
+        # Documents in values beyond size (or without the field) aren't in any bucket
+        other = max(term_counts.get('sum_other_doc_count', 0), total - sum(counts.values()))
+    except Exception:
+        return None
+
+    return total, counts, other, first_page_if_complete(result, total)
+
 class ProgressiveQueryBuilder:
     """Builds queries that stay under limit by progressive splitting"""
     
@@ -232,12 +688,17 @@ class ProgressiveQueryBuilder:
                 (f'{start_letter}u', end_letter + 'a')  # e.g., au-ba
             ]
     
-    def __init__(self, session, origin, limit=10000, verbose=True):
+    def __init__(self, session, origin, limit=10000, verbose=True, use_aggregations=None):
+        if use_aggregations is None:
+            use_aggregations = PROGRESSIVE_USE_AGGREGATIONS
         self.session = session
         self.origin = origin
         self.limit = limit
         self.verbose = verbose
+        self.use_aggregations = use_aggregations
         self.queries = []
+        self.asset_type_counts = {}
+        self.relationship_total = 0
         
     def log(self, message):
         if self.verbose:
@@ -249,14 +710,18 @@ class ProgressiveQueryBuilder:
         self.log("BUILDING QUERIES FOR OBJECTS")
         self.log("="*80)
         
+        if self.use_aggregations and self._plan_objects_with_aggregations():
+            return
+
         # Level 1: Try all objects at once
         query = build_base_query(self.origin)
         add_element_type_filter(query, "OBJECT")
-        result = test_query(self.session, query, self.limit, "All OBJECTS")
+        result = test_query(self.session, query, self.limit, "All OBJECTS", page_size=0)
         
         self.log(f"\nLevel 1 - All objects: {result['total']:,}")
         
         if not result['exceeds_limit']:
+            result['split'] = {'kind': 'objects'}
             self.queries.append(result)
             self.log(f"  ✓ Under {self.limit:,} - using single query")
             return
@@ -272,113 +737,174 @@ class ProgressiveQueryBuilder:
             
             result = test_query(self.session, query, self.limit, f"OBJECT:{type_name}")
             self.log(f"\n  Level 2 - {type_name}: {result['total']:,}")
+            self.asset_type_counts[asset_type] = result['total']
             
             if not result['exceeds_limit']:
                 if result['total'] > 0:  # Only add if has results
+                    result['split'] = {'kind': 'asset_type', 'asset_type': asset_type}
                     self.queries.append(result)
                     self.log(f"    ✓ Under {self.limit:,} - added query")
             else:
-                # Level 3: Split by alphabetic range
-                self.log(f"    ✗ Exceeds limit - splitting alphabetically...")
-                self._split_by_alpha(asset_type, type_name)
-    
-    def _split_by_alpha(self, asset_type, type_name):
-        """Split asset type by alphabetic ranges"""
-        type_name_short = type_name
-        
-        # Try 5-way split first
-        for start, end in self.ALPHA_RANGES_5:
-            range_label = get_range_label(start, end)
-            query = build_base_query(self.origin)
-            add_element_type_filter(query, "OBJECT")
-            add_type_filter(query, asset_type)
-            add_range_filter(query, start, end)
-            
-            result = test_query(self.session, query, self.limit, f"OBJECT:{type_name_short}:{range_label}")
-            self.log(f"      Level 3a - {type_name_short} [{range_label}]: {result['total']:,}")
-            
-            if not result['exceeds_limit']:
-                if result['total'] > 0:
-                    self.queries.append(result)
-                    self.log(f"        ✓ Under {self.limit:,} - added query")
+                # Level 3+: Split by name ranges
+                self.log(f"    ✗ Exceeds limit - splitting by name...")
+                self._plan_asset_type_by_name(asset_type, type_name, total=result['total'])
+
+    def _plan_objects_with_aggregations(self):
+        """Plan OBJECT queries from aggregation counts. Returns False if aggregations are unavailable."""
+        query = build_base_query(self.origin)
+        add_element_type_filter(query, "OBJECT")
+        counted = count_with_aggregation(self.session, query,
+                                         {asset_type: {"term": {"type": asset_type}} for asset_type in self.ASSET_TYPES})
+        if counted is None:
+            self.log("\nAggregations unavailable - falling back to count probes")
+            return False
+        ## Counted without hits (see PROBE_PAGE_SIZE): a single query is fetched with the rest of the plan
+        total, type_counts, _ = counted
+
+        self.log(f"\nLevel 1 - All objects: {total:,} (from aggregation)")
+
+        if total < self.limit:
+            self.queries.append(planned_query(query, total, self.limit, "All OBJECTS", {'kind': 'objects'}))
+            self.log(f"  ✓ Under {self.limit:,} - using single query")
+            return True
+
+        self.log(f"  ✗ Exceeds limit - splitting by asset type...")
+        for asset_type in self.ASSET_TYPES:
+            type_name = asset_type.split('.')[-1]
+            total = type_counts[asset_type]
+            self.asset_type_counts[asset_type] = total
+            self.log(f"\n  Level 2 - {type_name}: {total:,}")
+            if total == 0:
+                continue
+            self._plan_asset_type(asset_type, total)
+        return True
+
+    def _plan_asset_type(self, asset_type, total):
+        """Add an asset type to the plan, as one query or split by name"""
+        type_name = asset_type.split('.')[-1]
+        query = build_base_query(self.origin)
+        add_element_type_filter(query, "OBJECT")
+        add_type_filter(query, asset_type)
+        if total < self.limit:
+            self.queries.append(planned_query(query, total, self.limit, f"OBJECT:{type_name}",
+                                              {'kind': 'asset_type', 'asset_type': asset_type}))
+            self.log(f"    ✓ Under {self.limit:,} - added query")
+        else:
+            self.log(f"    ✗ Exceeds limit - splitting by name...")
+            self._plan_asset_type_by_name(asset_type, type_name, total=total)
+
+    def _name_range_query(self, asset_type, start, end):
+        query = build_base_query(self.origin)
+        add_element_type_filter(query, "OBJECT")
+        add_type_filter(query, asset_type)
+        add_range_filter(query, start, end)
+        return query
+
+    def _count_name_ranges(self, asset_type, ranges):
+        """Counts for each (start, end) range of an asset type in one aggregation request, or None"""
+        if not self.use_aggregations:
+            return None
+        query = build_base_query(self.origin)
+        add_element_type_filter(query, "OBJECT")
+        add_type_filter(query, asset_type)
+        counted = count_with_aggregation(self.session, query,
+                                         {get_range_label(s, e): build_range_filter(s, e) for s, e in ranges})
+        if counted is None:
+            return None
+        return [counted[1][get_range_label(s, e)] for s, e in ranges]
+
+    def _split_name_range(self, asset_type, type_name, start, end, total, depth=0):
+        """Recursively split [start, end) until every sub-range fits. Returns (start, end, count) leaves in order."""
+        ranges = split_name_range(start, end)
+        if len(ranges) == 0 or depth >= PROGRESSIVE_MAX_SPLIT_DEPTH:
+            return [(start, end, total)]
+
+        counts = self._count_name_ranges(asset_type, ranges)
+        if counts is None:
+            return self._bisect_name_ranges(asset_type, type_name, ranges, total, depth)
+
+        leaves = []
+        for (s, e), count in zip(ranges, counts):
+            if count >= self.limit:
+                self.log(f"{'  ' * depth}      Level {depth + 3} - {type_name} [{get_range_label(s, e)}]: {count:,} - splitting deeper...")
+                leaves.extend(self._split_name_range(asset_type, type_name, s, e, count, depth + 1))
             else:
-                # Level 4: Split to single letters
-                self.log(f"        ✗ Still exceeds - splitting to single letters...")
-                self._split_by_single_letter(asset_type, type_name_short, start, end)
-    
-    def _split_by_single_letter(self, asset_type, type_name, range_start, range_end):
-        """Split to single letter ranges"""
-        # Handle special case where range_start is None (for <a range)
-        if range_start is None:
-            # Can't split special characters further - just add the query
-            query = build_base_query(self.origin)
-            add_element_type_filter(query, "OBJECT")
-            add_type_filter(query, asset_type)
-            add_range_filter(query, None, range_end)
-            result = test_query(self.session, query, self.limit, f"OBJECT:{type_name}:<{range_end}")
-            self.queries.append(result)
-            self.log(f"            ⚠️  WARNING: Special characters range [{result['total']:,}] cannot be split further!")
-            return
-        
-        # Get relevant single-letter ranges
-        relevant_ranges = [
-            (s, e) for s, e in self.ALPHA_RANGES_26 
-            if s is not None and s >= range_start and (range_end is None or s < range_end)
-        ]
-        
-        for start, end in relevant_ranges:
-            range_label = get_range_label(start, end)
-            query = build_base_query(self.origin)
-            add_element_type_filter(query, "OBJECT")
-            add_type_filter(query, asset_type)
-            add_range_filter(query, start, end)
-            
-            result = test_query(self.session, query, self.limit, f"OBJECT:{type_name}:{range_label}")
-            self.log(f"          Level 4 - {type_name} [{range_label}]: {result['total']:,}")
-            
-            if result['total'] > 0:
-                if result['exceeds_limit']:
-                    # Level 5: Split by two-letter ranges
-                    self.log(f"            ✗ Still exceeds {self.limit:,} - splitting to two-letter ranges...")
-                    self._split_by_two_letters(asset_type, type_name, start, end)
-                else:
-                    self.queries.append(result)
-                    self.log(f"            ✓ Under {self.limit:,} - added query")
-    
-    def _split_by_two_letters(self, asset_type, type_name, letter_start, letter_end):
-        """Split to two-letter ranges (aa-af, af-ak, etc.)"""
-        # Generate two-letter ranges for this letter
-        two_letter_ranges = self.generate_two_letter_ranges(letter_start, letter_end)
-        
-        for start, end in two_letter_ranges:
+                leaves.append((s, e, count))
+        return leaves
+
+    def _bisect_name_ranges(self, asset_type, type_name, ranges, total, depth):
+        """Without aggregations: probe halves of the contiguous sub-ranges until each half fits"""
+        start, end = ranges[0][0], ranges[-1][1]
+        if total < self.limit:
+            return [(start, end, total)]
+        if len(ranges) == 1:
+            return self._split_name_range(asset_type, type_name, start, end, total, depth + 1)
+
+        leaves = []
+        middle = len(ranges) // 2
+        for half in (ranges[:middle], ranges[middle:]):
+            s, e = half[0][0], half[-1][1]
+            result = test_query(self.session, self._name_range_query(asset_type, s, e), self.limit,
+                                f"OBJECT:{type_name}:{get_range_label(s, e)}", page_size=0)
+            self.log(f"{'  ' * depth}      Level {depth + 3} - {type_name} [{get_range_label(s, e)}]: {result['total']:,}")
+            leaves.extend(self._bisect_name_ranges(asset_type, type_name, half, result['total'], depth))
+        return leaves
+
+    def _plan_asset_type_by_name(self, asset_type, type_name, start=None, end=None, total=None):
+        """Split an asset type's name range from the observed counts and add the merged chunks to the plan"""
+        if total is None:
+            total = self.limit
+        leaves = self._split_name_range(asset_type, type_name, start, end, total)
+
+        for start, end, total in self._merge_ranges(leaves):
             range_label = get_range_label(start, end)
-            query = build_base_query(self.origin)
-            add_element_type_filter(query, "OBJECT")
-            add_type_filter(query, asset_type)
-            add_range_filter(query, start, end)
-            
-            result = test_query(self.session, query, self.limit, f"OBJECT:{type_name}:{range_label}")
-            self.log(f"              Level 5 - {type_name} [{range_label}]: {result['total']:,}")
-            
-            if result['total'] > 0:
-                self.queries.append(result)
-                if result['exceeds_limit']:
-                    self.log(f"                ⚠️  CRITICAL: Still exceeds {self.limit:,} after two-letter split!")
-                else:
-                    self.log(f"                ✓ Under {self.limit:,} - added query")
-    
+            self.queries.append(planned_query(self._name_range_query(asset_type, start, end), total, self.limit,
+                                              f"OBJECT:{type_name}:{range_label}",
+                                              {'kind': 'name_range', 'asset_type': asset_type, 'start': start, 'end': end}))
+            if total >= self.limit:
+                self.log(f"        ⚠️  WARNING: {type_name} [{range_label}] ({total:,}) cannot be split further by name!")
+            else:
+                self.log(f"        ✓ {type_name} [{range_label}]: {total:,} - added query")
+
+    def _merge_ranges(self, leaves):
+        """
+        Merge adjacent (start, end, count) ranges while the combined count stays under the limit.
+        Empty ranges are always folded into a neighbour so the merged ranges still cover everything.
+        """
+        merged = []
+        pending_start = None
+        has_pending = False
+        for start, end, count in leaves:
+            if has_pending:
+                start = pending_start
+                has_pending = False
+            if len(merged) == 0 and count == 0:
+                pending_start = start
+                has_pending = True
+                continue
+            if len(merged) > 0 and (count == 0 or merged[-1][2] + count < self.limit):
+                merged[-1] = (merged[-1][0], end, merged[-1][2] + count)
+            else:
+                merged.append((start, end, count))
+        return merged
+
     def build_queries_for_relationships(self):
         """Build queries for RELATIONSHIP elements with progressive splitting"""
         self.log("\n" + "="*80)
         self.log("BUILDING QUERIES FOR RELATIONSHIPS")
         self.log("="*80)
+
+        if RELATIONSHIP_PUSHDOWN:
+            self._plan_relationships_by_type()
+            return
         
         # First, try all relationships
         query = build_base_query(self.origin)
         add_element_type_filter(query, "RELATIONSHIP")
         
-        result = test_query(self.session, query, self.limit, "All RELATIONSHIPS")
+        result = test_query(self.session, query, self.limit, "All RELATIONSHIPS", page_size=0)
         self.log(f"\nAll relationships: {result['total']:,}")
+        self.relationship_total = result['total']
         
         if result['total'] == 0:
             return
@@ -392,6 +918,119 @@ class ProgressiveQueryBuilder:
             self.log(f"  ✗ Exceeds {self.limit:,} - splitting by relationship type name...")
             self._split_relationships_by_alpha()
     
+    def _relationship_query(self, clauses=(), start=None, end=None):
+        query = build_base_query(self.origin)
+        add_element_type_filter(query, "RELATIONSHIP")
+        add_relationship_pushdown_filter(query)
+        query["query"]["bool"]["filter"].extend(clauses)
+        range_filter = build_range_filter(start, end, field="core.sourceIdentity")
+        if range_filter is not None:
+            query["query"]["bool"]["filter"].append(range_filter)
+        return query
+
+    def _plan_relationships_by_type(self):
+        """Plan the pushed-down relationships: exact-type chunks packed under the limit, large types split by identity"""
+        query = self._relationship_query()
+        counted = None
+        if self.use_aggregations:
+            counted = count_by_terms(self.session, query, "type", RELATIONSHIP_TYPE_BUCKETS)
+
+        if counted is None:
+            # No aggregations: the types aren't known, so split the whole set by identity if needed
+            result = test_query(self.session, query, self.limit, "All RELATIONSHIPS", page_size=0)
+            self.relationship_total = result['total']
+            self.log(f"\nAll relationships (pushed down): {result['total']:,}")
+            if result['total'] == 0:
+                return
+            if not result['exceeds_limit']:
+                self.queries.append(result)
+                self.log(f"  ✓ Under {self.limit:,} - added query")
+            else:
+                self.log(f"  ✗ Exceeds {self.limit:,} - splitting by source identity...")
+                self._plan_relationships_by_identity([], "RELATIONSHIP", result['total'])
+            return
+
+        ## Counted without hits (see PROBE_PAGE_SIZE): a single query is fetched with the rest of the plan
+        total, type_counts, other, _ = counted
+        self.relationship_total = total
+        self.log(f"\nAll relationships (pushed down): {total:,} in {len(type_counts)} types (from aggregation)")
+        if total == 0:
+            return
+        if total < self.limit:
+            self.queries.append(planned_query(query, total, self.limit, "All RELATIONSHIPS"))
+            self.log(f"  ✓ Under {self.limit:,} - using single query")
+            return
+
+        self.log(f"  ✗ Exceeds {self.limit:,} - partitioning by relationship type...")
+        # First-fit decreasing: each chunk is a set of whole types whose counts add up to less than the limit
+        chunks = []
+        for rel_type, count in sorted(type_counts.items(), key=lambda item: (-item[1], item[0])):
+            if count >= self.limit:
+                self.log(f"    {rel_type.split('.')[-1]}: {count:,} - splitting by source identity...")
+                self._plan_relationships_by_identity([{"term": {"type": rel_type}}],
+                                                     f"RELATIONSHIP:{rel_type.split('.')[-1]}", count)
+                continue
+            for chunk in chunks:
+                if chunk[1] + count < self.limit:
+                    chunk[0].append(rel_type)
+                    chunk[1] += count
+                    break
+            else:
+                chunks.append([[rel_type], count])
+
+        for rel_types, count in chunks:
+            description = f"RELATIONSHIP:{rel_types[0].split('.')[-1]}"
+            if len(rel_types) > 1:
+                description += f"+{len(rel_types) - 1}"
+            self.queries.append(planned_query(self._relationship_query([{"terms": {"type": rel_types}}]),
+                                              count, self.limit, description))
+            self.log(f"    ✓ {description}: {count:,} - added query")
+
+        if other > 0:
+            # More types than aggregation buckets - everything not listed goes in one more chunk
+            rest = [{"bool": {"must_not": [{"terms": {"type": sorted(type_counts)}}]}}]
+            self.log(f"    Other types: {other:,}")
+            if other >= self.limit:
+                self._plan_relationships_by_identity(rest, "RELATIONSHIP:other", other)
+            else:
+                self.queries.append(planned_query(self._relationship_query(rest), other, self.limit, "RELATIONSHIP:other"))
+
+    def _count_identity_ranges(self, clauses, ranges, description):
+        """Counts for each (start, end) core.sourceIdentity range: one aggregation request, or one probe each"""
+        if self.use_aggregations:
+            counted = count_with_aggregation(self.session, self._relationship_query(clauses),
+                                             {get_range_label(s, e): build_range_filter(s, e, field="core.sourceIdentity")
+                                              for s, e in ranges})
+            if counted is not None:
+                return [counted[1][get_range_label(s, e)] for s, e in ranges]
+        return [test_query(self.session, self._relationship_query(clauses, s, e), self.limit,
+                           f"{description}:{get_range_label(s, e)}", page_size=0)['total']
+                for s, e in ranges]
+
+    def _split_identity_range(self, clauses, description, start, end, total, depth=0):
+        """Recursively split a core.sourceIdentity range until every sub-range fits. Returns (start, end, count) leaves."""
+        ranges = split_name_range(start, end, RELATIONSHIP_SPLIT_ALPHABET)
+        if len(ranges) == 0 or depth >= PROGRESSIVE_MAX_SPLIT_DEPTH:
+            return [(start, end, total)]
+        leaves = []
+        for (s, e), count in zip(ranges, self._count_identity_ranges(clauses, ranges, description)):
+            if count >= self.limit:
+                leaves.extend(self._split_identity_range(clauses, description, s, e, count, depth + 1))
+            else:
+                leaves.append((s, e, count))
+        return leaves
+
+    def _plan_relationships_by_identity(self, clauses, description, total):
+        """Add relationship chunks split on core.sourceIdentity ranges to the plan"""
+        for start, end, count in self._merge_ranges(self._split_identity_range(clauses, description, None, None, total)):
+            range_label = get_range_label(start, end)
+            self.queries.append(planned_query(self._relationship_query(clauses, start, end), count, self.limit,
+                                              f"{description}:{range_label}"))
+            if count >= self.limit:
+                self.log(f"      ⚠️  WARNING: {description} [{range_label}] ({count:,}) cannot be split further!")
+            else:
+                self.log(f"      ✓ {description} [{range_label}]: {count:,} - added query")
+
     def _split_relationships_by_alpha(self):
         """Split relationships alphabetically by their type name (using wildcards)"""
         # Try 5-way split first
@@ -500,9 +1139,14 @@ class ProgressiveQueryBuilder:
                     self.log(f"              ✓ Under {self.limit:,} - added query")
     
     def build_all_queries(self):
-        """Build all necessary queries"""
-        self.build_queries_for_objects()
-        self.build_queries_for_relationships()
+        """Build all necessary queries, reusing (and re-verifying) a cached plan when one exists"""
+        cached_plan = load_cached_query_plan(self.origin, self.limit)
+        if cached_plan is None or not self._reuse_cached_plan(cached_plan):
+            self.queries = []
+            self.asset_type_counts = {}
+            self.build_queries_for_objects()
+            self._build_relationship_queries()
+        save_cached_query_plan(self.origin, self.limit, self.queries, self.asset_type_counts, self.relationship_total)
         
         self.log("\n" + "="*80)
         self.log(f"FINAL QUERY PLAN: {len(self.queries)} queries")
@@ -515,6 +1159,95 @@ class ProgressiveQueryBuilder:
         
         return self.queries
 
+    def _build_relationship_queries(self):
+        first_relationship_query = len(self.queries)
+        self.build_queries_for_relationships()
+        for q in self.queries[first_relationship_query:]:
+            q['split'] = {'kind': 'relationships'}
+
+    def _verify_counts(self, named_queries):
+        """Current counts for {name: query clause} - one aggregation request, or one probe each"""
+        base_query = {"from": 0, "size": 0, "query": {"bool": {"filter": [{"term": {"core.origin": self.origin}}]}}}
+        counted = None
+        if self.use_aggregations:
+            counted = count_with_aggregation(self.session, base_query, named_queries)
+        if counted is not None:
+            return counted[1]
+        counts = {}
+        for name, clause in named_queries.items():
+            query = build_base_query(self.origin)
+            query["query"]["bool"]["filter"].append(clause)
+            counts[name] = test_query(self.session, query, self.limit, name, page_size=0)['total']
+        return counts
+
+    def _has_drifted(self, old_total, new_total):
+        return abs(new_total - old_total) > QUERY_PLAN_DRIFT_THRESHOLD * max(old_total, 1)
+
+    def _reuse_cached_plan(self, cached_plan):
+        """
+        Verify a cached plan's chunk counts and re-split only the chunks that drifted past the limit.
+        Returns False if the plan has to be rebuilt from scratch.
+        """
+        self.log("\n" + "="*80)
+        self.log(f"VERIFYING CACHED QUERY PLAN ({len(cached_plan['queries'])} queries)")
+        self.log("="*80)
+
+        named_queries = {f"chunk:{i}": q['query']['query'] for i, q in enumerate(cached_plan['queries'])}
+        for asset_type in cached_plan['asset_type_counts']:
+            named_queries[f"type:{asset_type}"] = {"bool": {"filter": [{"term": {"elementType": "OBJECT"}}, {"term": {"type": asset_type}}]}}
+        named_queries["relationships"] = relationship_clause()
+        counts = self._verify_counts(named_queries)
+
+        self.queries = []
+        self.asset_type_counts = {}
+        self.relationship_total = counts["relationships"]
+
+        relationships_drifted = self._has_drifted(cached_plan['relationship_total'], self.relationship_total)
+        relationship_queries = []
+        planned_types = set()
+        for i, cached_query in enumerate(cached_plan['queries']):
+            split = cached_query.get('split') or {}
+            old_total = cached_query['total']
+            total = counts[f"chunk:{i}"]
+            query = planned_query(cached_query['query'], total, self.limit, cached_query['description'], split)
+
+            if split.get('kind') == 'relationships':
+                relationships_drifted = relationships_drifted or total >= self.limit
+                relationship_queries.append(query)
+                continue
+
+            planned_types.add(split.get('asset_type'))
+            if total < self.limit:
+                if self._has_drifted(old_total, total):
+                    self.log(f"  {cached_query['description']}: {old_total:,} → {total:,} (still fits)")
+                self.queries.append(query)
+            elif split.get('kind') == 'name_range':
+                self.log(f"  {cached_query['description']}: {old_total:,} → {total:,} - re-splitting")
+                self._plan_asset_type_by_name(split['asset_type'], split['asset_type'].split('.')[-1],
+                                              split['start'], split['end'], total)
+            elif split.get('kind') == 'asset_type':
+                self.log(f"  {cached_query['description']}: {old_total:,} → {total:,} - re-splitting")
+                self._plan_asset_type(split['asset_type'], total)
+            else:
+                self.log(f"  {cached_query['description']}: {old_total:,} → {total:,} - rebuilding plan")
+                return False
+
+        # Asset types that had no objects when the plan was made
+        for asset_type, old_total in cached_plan['asset_type_counts'].items():
+            total = counts[f"type:{asset_type}"]
+            self.asset_type_counts[asset_type] = total
+            if asset_type not in planned_types and total > 0:
+                self.log(f"  {asset_type.split('.')[-1]}: {old_total:,} → {total:,} - adding to plan")
+                self._plan_asset_type(asset_type, total)
+
+        if relationships_drifted:
+            self.log(f"  Relationships: {cached_plan['relationship_total']:,} → {self.relationship_total:,} - replanning relationships")
+            self._build_relationship_queries()
+        else:
+            self.queries.extend(relationship_queries)
+
+        return True
+
 
 if __name__ == "__main__":
     print("This module provides progressive query splitting.")
@@ -525,75 +1258,205 @@ if __name__ == "__main__":
 # ============================================================================
 
 
+class INFAObjectRegistry(list):
+    """
+    List of catalog objects that keeps identity, name and origin indexes up to date
+    as objects are added, so lookups don't have to scan the whole list.
+
+    When two objects share an identity, the last one registered wins, as in the original
+    relationship linking scan. Names and origins keep the first object registered, as in the
+    original getObjectByName / getObjectByLocationID scans. Any change other than adding to
+    the end re-indexes the whole list.
+    """
+
+    def __init__(self, objects=()):
+        super().__init__()
+        self.by_identity = {}
+        self.by_name = {}
+        self.by_origin = {}
+        self.extend(objects)
+
+    def _index(self, obj):
+        self.by_identity[obj.identity] = obj
+        self.by_name.setdefault(obj.name, obj)
+        self.by_origin.setdefault(obj.origin, obj)
+
+    def _reindex(self):
+        ## Cleared in place, since callers may hold on to the index dicts
+        self.by_identity.clear()
+        self.by_name.clear()
+        self.by_origin.clear()
+        for obj in self:
+            self._index(obj)
+
+    def append(self, obj):
+        super().append(obj)
+        self._index(obj)
+
+    def extend(self, objects):
+        for obj in objects:
+            self.append(obj)
+
+    def __iadd__(self, objects):
+        self.extend(objects)
+        return self
+
+    def insert(self, index, obj):
+        super().insert(index, obj)
+        self._reindex()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reindex()
+
+    def remove(self, obj):
+        super().remove(obj)
+        self._reindex()
+
+    def pop(self, index=-1):
+        obj = super().pop(index)
+        self._reindex()
+        return obj
+
+    def clear(self):
+        super().clear()
+        self._reindex()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._reindex()
+
+    def reverse(self):
+        super().reverse()
+        self._reindex()
+
+
 class INFA_DG_Object:
 
+    ## Hundreds of thousands of these can be loaded at once, so they have no per-instance __dict__,
+    ## and the relationship lists share an empty tuple until something is added (see add* below)
+    __slots__ = ("session", "name", "description", "origin", "externalId", "classType", "shortType",
+                 "elementType", "identity", "isResource", "isDataSet", "isDataElement", "map",
+                 "classifications", "businessterms", "objects", "parent_objects", "child_objects",
+                 "parentPolicies", "friendlyId", "dbPath", "dbParentPath",
+                 "_policy_rollup", "_policy_rollup_version")
+
+    ## sourceAsMap fields kept as attributes - getvalue() reads these even when the map was dropped
+    FIELD_ATTRIBUTES = {
+        "core.name": "name",
+        "core.description": "description",
+        "core.origin": "origin",
+        "core.externalId": "externalId",
+        "core.classType": "classType",
+        "elementType": "elementType",
+        "core.identity": "identity",
+    }
+
     def debug(self, message):
         if debugFlag:
             print(f"DEBUG: {message}")
 
     def getvalue(self, key):
+        attribute = self.FIELD_ATTRIBUTES.get(key)
+        if attribute is not None:
+            return getattr(self, attribute)
+        if self.map is None:
+            raise KeyError(key)
         return self.map[key]
-    
-    def fetchOtherRelationships(self):
 
-        ## Search for Glossary Relatopnsips
-        payload_dict = {
-            "from": 0,
-            "size": 100,
-            "query": {
-                "bool": {
-                    "filter": [
-                        {"term": {"elementType": "RELATIONSHIP" }},
-                        {"term": {"type":"com.infa.ccgf.models.governance.IClassTechnicalGlossaryBase" }}
-                        
-                    ]
-                }
-            },
-            "sort": [
-                {
-                    "com.infa.ccgf.models.governance.scannedTime": {
-                        "order": "desc"
-                    }
-                }
-            ]
-        }
+    def stateMap(self):
+        ## The fields INFA_DG_Object reads, to rebuild this object from a saved catalog state
+        state_map = {key: self.map[key] for key in EXTRA_SOURCE_FIELDS if self.map and key in self.map}
+        types = []
+        if self.isDataSet:
+            types.append("core.DataSet")
+        if self.isDataElement:
+            types.append("core.DataElement")
+        state_map.update({
+            "core.identity": self.identity,
+            "core.name": self.name,
+            "core.description": self.description,
+            "core.origin": self.origin,
+            "core.externalId": self.externalId,
+            "core.classType": self.classType,
+            "elementType": self.elementType,
+            "type": types
+        })
+        return state_map
 
-        results = self.session.elasticSearchResults(payload_dict)
+    def addObject(self, obj):
+        if self.objects:
+            self.objects.append(obj)
+        else:
+            self.objects = [obj]
 
-        self.debug(f"Total results from fetchOtherRelationships elasticsearch: {len(results)}")
+    def addChild(self, child):
+        if self.child_objects:
+            self.child_objects.append(child)
+        else:
+            self.child_objects = [child]
+        if child.parent_objects:
+            child.parent_objects.append(self)
+        else:
+            child.parent_objects = [self]
 
-        for search_obj in results:
-            
-            try:
-                raw_map = search_obj['sourceAsMap']
-                if search_obj['sourceAsMap']['elementType'] == 'RELATIONSHIP' and 'ACCEPTED' in raw_map['core.curationStatus'] and ( self.origin == raw_map['core.sourceOrigin']  or self.origin == raw_map['core.targetOrigin']):
+    def addClassification(self, classification):
+        if self.classifications:
+            self.classifications.append(classification)
+        else:
+            self.classifications = [classification]
+
+    def addBusinessTerm(self, term):
+        if self.businessterms:
+            self.businessterms.append(term)
+        else:
+            self.businessterms = [term]
+    
+    def fetchOtherRelationships(self):
+        relationship_pairs = self.searchOtherRelationshipPairs()
 
-                    source_id = raw_map['core.sourceIdentity']
-                    target_id = raw_map['core.targetIdentity']
+        ## Resolve both ends of every relationship in a few batched lookups instead of one search per identity
+        identities = [source_id for source_id, target_id in relationship_pairs] + [target_id for source_id, target_id in relationship_pairs]
+        self.session.resolveObjectsByID(identities)
 
-                    source_obj = self.session.getObjectByID(source_id)
-                    target_obj = self.session.getObjectByID(target_id)
-                    
-                    
-                    if target_obj.classType == 'core.DataElementClassification' or target_obj.classType == 'core.DataEntityClassification':
-                        if not target_obj in source_obj.classifications:
-                            source_obj.classifications.append(target_obj)
-                    elif target_obj.classType == 'com.infa.ccgf.models.governance.BusinessTerm':
-                        if not target_obj in source_obj.businessterms:
-                            source_obj.businessterms.append(target_obj)
+        for source_id, target_id in relationship_pairs:
+            try:
+                source_obj = self.session.getObjectByID(source_id)
+                target_obj = self.session.getObjectByID(target_id)
+
+                if target_obj.classType == 'core.DataElementClassification' or target_obj.classType == 'core.DataEntityClassification':
+                    if not target_obj in source_obj.classifications:
+                        source_obj.addClassification(target_obj)
+                elif target_obj.classType == 'com.infa.ccgf.models.governance.BusinessTerm':
+                    if not target_obj in source_obj.businessterms:
+                        source_obj.addBusinessTerm(target_obj)
             except:
-                pass        
+                pass
+
+        self.session.relationshipsChanged()
 
-        ## Search for Classification Relatopnsips
+    def searchOtherRelationshipPairs(self):
+        ## Search for Glossary and Classification Relationships touching this origin. The curation status
+        ## is checked client-side (collectAcceptedOriginRelationships), as its mapping isn't a known keyword field
         payload_dict = {
             "from": 0,
-            "size": 100,
+            "size": 10000,
             "query": {
                 "bool": {
                     "filter": [
                         {"term": {"elementType": "RELATIONSHIP" }},
-                        {"term": {"type":"core.ClassifiedAs" }}
-                        
+                        {"terms": {"type": ["com.infa.ccgf.models.governance.IClassTechnicalGlossaryBase", "core.ClassifiedAs"] }},
+                        {"bool": {
+                            "should": [
+                                {"term": {"core.sourceOrigin": self.origin }},
+                                {"term": {"core.targetOrigin": self.origin }}
+                            ],
+                            "minimum_should_match": 1
+                        }}
                     ]
                 }
             },
@@ -610,26 +1473,18 @@ class INFA_DG_Object:
 
         self.debug(f"Total results from fetchOtherRelationships elasticsearch: {len(results)}")
 
+        return self.collectAcceptedOriginRelationships(results)
+
+    def collectAcceptedOriginRelationships(self, results):
+        relationship_pairs = []
         for search_obj in results:
-            
             try:
                 raw_map = search_obj['sourceAsMap']
                 if search_obj['sourceAsMap']['elementType'] == 'RELATIONSHIP' and 'ACCEPTED' in raw_map['core.curationStatus'] and ( self.origin == raw_map['core.sourceOrigin']  or self.origin == raw_map['core.targetOrigin']):
-                    source_id = raw_map['core.sourceIdentity']
-                    target_id = raw_map['core.targetIdentity']
-
-                    source_obj = self.session.getObjectByID(source_id)
-                    target_obj = self.session.getObjectByID(target_id)
-                    
-                    
-                    if target_obj.classType == 'core.DataElementClassification' or target_obj.classType == 'core.DataEntityClassification':
-                        if not target_obj in source_obj.classifications:
-                            source_obj.classifications.append(target_obj)
-                    elif target_obj.classType == 'com.infa.ccgf.models.governance.BusinessTerm':
-                        if not target_obj in source_obj.businessterms:
-                            source_obj.businessterms.append(target_obj)
+                    relationship_pairs.append((raw_map['core.sourceIdentity'], raw_map['core.targetIdentity']))
             except:
                 pass
+        return relationship_pairs
 
     def fetchObjects(self, use_progressive=True, limit=None, verbose=None):
         """
@@ -658,14 +1513,11 @@ class INFA_DG_Object:
             else:
                 print(f"INFO: Executing {len(queries)} progressive queries...")
             
-            # Execute all queries and collect results
-            all_results = []
-            for i, query_info in enumerate(queries, 1):
-                if verbose:
-                    print(f"  Fetching Query {i}/{len(queries)}: {query_info['description']} (expecting ~{query_info['total']:,} results)...")
-                
+            # Prepare every query for fetching
+            import copy
+            query_dicts = []
+            for query_info in queries:
                 # Create a deep copy of the query and prepare for fetching
-                import copy
                 query_dict = copy.deepcopy(query_info['query'])
                 # Ensure query structure is clean for elasticSearchResults
                 # elasticSearchResults will set 'from' and 'size' itself
@@ -673,15 +1525,26 @@ class INFA_DG_Object:
                     del query_dict['from']
                 if 'size' in query_dict:
                     del query_dict['size']
-                
-                # Execute this query with pagination
-                results = self.session.elasticSearchResults(query_dict)
-                
+                query_dicts.append(query_dict)
+
+            # Queries whose count probe already returned every hit don't need to be sent again
+            to_fetch = [i for i, query_info in enumerate(queries) if query_info.get('results') is None]
+            if len(to_fetch) < len(queries):
+                print(f"INFO: Reusing probe results for {len(queries) - len(to_fetch)} of {len(queries)} queries")
+
+            # Execute the remaining queries concurrently (with pagination), results come back in plan order
+            results_per_query = [query_info.pop('results', None) for query_info in queries]
+            for i, results in zip(to_fetch, self.session.elasticSearchResultsMany([query_dicts[i] for i in to_fetch])):
+                results_per_query[i] = results
+
+            all_results = []
+            for i, (query_info, results) in enumerate(zip(queries, results_per_query), 1):
                 if verbose:
-                    print(f"    Retrieved {len(results)} results")
+                    print(f"  Query {i}/{len(queries)}: {query_info['description']} (expected ~{query_info['total']:,}) - retrieved {len(results)} results")
                 
                 self.debug(f"    Query {i}: Retrieved {len(results)} results (expected {query_info['total']})")
                 all_results.extend(results)
+            results_per_query = None
             
             print(f"INFO: Total results collected: {len(all_results):,}")
             
@@ -742,58 +1605,494 @@ class INFA_DG_Object:
             self.debug(f"Total results from fetchObjects elasticsearch: {len(all_results)}")
         
         # Process results (same for both modes)
-        # First pass: Create OBJECT instances
+        # First pass: Create OBJECT instances, with their paths resolved against this origin's resource once.
+        # Relationships are kept as compact tuples so the raw results can be released before linking.
+        origin_resource = self.session.getObjectByLocationID(self.origin)
+        relationships = []
         for obj in all_results:
             try:
-                if obj['sourceAsMap']['elementType'] == 'OBJECT':
-                    raw_map = obj['sourceAsMap']
-                    
+                raw_map = obj['sourceAsMap']
+                if raw_map['elementType'] == 'OBJECT':
                     object = INFA_DG_Object(self.session, raw_map)
-                    self.objects.append(object)
+                    if origin_resource is not None:
+                        object.setFriendlyId(origin_resource.name)
+                    self.addObject(object)
                     self.session.all_objects.append(object)
+                elif raw_map['elementType'] == 'RELATIONSHIP':
+                    relationships.append((raw_map['core.sourceIdentity'], raw_map['core.targetIdentity'],
+                                          raw_map.get('core.associationKind'),
+                                          'ACCEPTED' in raw_map.get('core.curationStatus', ())))
             except:
                 pass
+        all_results = None
 
         # Second pass: Process RELATIONSHIP instances
-        for obj in all_results:
+        by_identity = self.session.all_objects.by_identity
+        for source_id, target_id, association_kind, accepted in relationships:
             try:
-                if obj['sourceAsMap']['elementType'] == 'RELATIONSHIP':
-                    raw_map = obj['sourceAsMap']
-                    source_id = raw_map['core.sourceIdentity']
-                    target_id = raw_map['core.targetIdentity']
-
-                    target_obj = None
-                    source_obj = None
-                    for o in self.session.all_objects:
-                        if o.identity == source_id:
-                            source_obj = o
-                        if o.identity == target_id:
-                            target_obj = o
+                source_obj = by_identity.get(source_id)
+                target_obj = by_identity.get(target_id)
 
-                    try:
-                        if obj['sourceAsMap']['core.associationKind'] == "core.ParentChild":
-                            if source_obj != None and target_obj != None:
-                                source_obj.child_objects.append(target_obj)
-                                target_obj.parent_objects.append(source_obj)
-                    except:
-                        pass
+                if association_kind == "core.ParentChild":
+                    if source_obj != None and target_obj != None:
+                        source_obj.addChild(target_obj)
 
-                    '''
-                    if source_id == '9b7f40c3-c1fe-45e5-9c8c-c945b11c4c2d' or target_id == '9b7f40c3-c1fe-45e5-9c8c-c945b11c4c2d':
-                        print(f"DEBUG** {source_obj.name} ({source_obj.externalId}) --> {target_obj.name} ({target_obj.externalId})")
-                    '''
-                    
-                    if 'ACCEPTED' in raw_map['core.curationStatus'] and (target_obj.classType == 'core.DataElementClassification' or target_obj.classType == 'core.DataEntityClassification'):
-                        source_obj.classifications.append(target_obj)
-                    elif 'ACCEPTED' in raw_map['core.curationStatus'] and (target_obj.classType == 'com.infa.ccgf.models.governance.BusinessTerm'):
-                        source_obj.businessterms.append(target_obj)
+                if accepted and (target_obj.classType == 'core.DataElementClassification' or target_obj.classType == 'core.DataEntityClassification'):
+                    source_obj.addClassification(target_obj)
+                elif accepted and (target_obj.classType == 'com.infa.ccgf.models.governance.BusinessTerm'):
+                    source_obj.addBusinessTerm(target_obj)
             except:
                 pass
+
+        self.session.relationshipsChanged()
         
         ## Don't need to run this, as we've already got all of the relationships above.
         self.fetchOtherRelationships()
 
 
+    def streamObjects(self, limit=None, verbose=None):
+        """
+        Generator version of fetchObjects for resources too large to hold in memory.
+
+        Relationships are fetched first and kept as compact identity tuples. Object pages are
+        then streamed, and each object is yielded as soon as it and every object below it in the
+        hierarchy have loaded, with its classifications, business terms and children linked
+        (so a table comes after all of its columns). Objects left waiting on children that
+        never arrive are yielded at the end.
+
+        Once the consumer moves on from an object, its policy rollup is cached and its
+        child_objects are released. Streamed objects aren't kept in self.objects or
+        session.all_objects. Load the governance collections (policies, classifications,
+        business terms) before streaming, since loading them invalidates cached rollups.
+
+        Memory isn't constant. Relationship hits are read a page at a time, but the identity maps
+        built from them (parent/child edges and accepted links of the whole resource) are held for
+        the whole run, and an object is held until its children and its parents have arrived.
+        Object queries are run parent types first (ProgressiveQueryBuilder.ASSET_TYPES order), so
+        columns stream through as soon as they arrive while databases, schemas, tables and views
+        wait for them: the peak is about those identity maps plus that parent layer, not the
+        columns. Once every query of a type has run, complete objects still waiting for a parent
+        that was never fetched are released.
+        """
+        if limit is None:
+            limit = PROGRESSIVE_QUERY_LIMIT
+        if verbose is None:
+            verbose = verboseSearchFlag
+
+        print(f"INFO: Streaming Detailed Information for {self.name}")
+        builder = ProgressiveQueryBuilder(self.session, self.origin, limit=limit, verbose=verbose)
+        queries = builder.build_all_queries()
+        relationship_queries = [q for q in queries if (q.get('split') or {}).get('kind') == 'relationships']
+        object_queries = [q for q in queries if (q.get('split') or {}).get('kind') != 'relationships']
+        ## Parents first (cached plans and name splits included), so the much larger column layer never waits
+        type_order = {asset_type: i for i, asset_type in enumerate(ProgressiveQueryBuilder.ASSET_TYPES)}
+        object_queries.sort(key=lambda q: type_order.get((q.get('split') or {}).get('asset_type'), -1))
+
+        ## Relationships first: parent/child edges and accepted classification / business term links
+        children_of = {}
+        parents_of = {}
+        links_of = {}
+        link_targets = set()
+        seen_edges = set()
+        for query_info in relationship_queries:
+            results = query_info.pop('results', None)
+            if results is None:
+                ## One page at a time, folded into the maps before the next page is fetched
+                pages = self.session.elasticSearchPages({k: v for k, v in query_info['query'].items() if k not in ('from', 'size')})
+            else:
+                pages = [results]
+            for page in pages:
+                for result in page:
+                    try:
+                        raw_map = result['sourceAsMap']
+                        source_id = raw_map['core.sourceIdentity']
+                        target_id = raw_map['core.targetIdentity']
+                        if raw_map.get('core.associationKind') == "core.ParentChild":
+                            if (source_id, target_id) not in seen_edges:
+                                seen_edges.add((source_id, target_id))
+                                children_of.setdefault(source_id, []).append(target_id)
+                                parents_of.setdefault(target_id, []).append(source_id)
+                        elif 'ACCEPTED' in raw_map.get('core.curationStatus', ()):
+                            links_of.setdefault(source_id, []).append(target_id)
+                            if raw_map.get('core.targetOrigin') != self.origin:
+                                link_targets.add(target_id)
+                    except:
+                        pass
+            results = None
+            pages = None
+        seen_edges = None
+
+        for source_id, target_id in self.searchOtherRelationshipPairs():
+            links_of.setdefault(source_id, []).append(target_id)
+            link_targets.add(target_id)
+        self.session.resolveObjectsByID(link_targets)
+        link_targets = None
+        print(f"INFO: Loaded {sum(len(c) for c in children_of.values()):,} parent/child and {sum(len(l) for l in links_of.values()):,} glossary/classification relationships")
+
+        by_identity = self.session.all_objects.by_identity
+        origin_resource = self.session.getObjectByLocationID(self.origin)
+        loaded = {}                 # identity -> object, until it's complete and linked to all of its parents
+        incomplete_children = {}    # identity of a loaded object -> children that aren't complete yet
+        complete = set()
+        ready = []
+
+        def evict_if_done(identity):
+            if identity in complete and identity in loaded and all(p in loaded or p in complete for p in parents_of.get(identity, ())):
+                del loaded[identity]
+
+        def load(obj):
+            identity = obj.identity
+            loaded[identity] = obj
+            for target_id in links_of.get(identity, ()):
+                target_obj = by_identity.get(target_id)
+                if target_obj is None:
+                    continue
+                if target_obj.classType == 'core.DataElementClassification' or target_obj.classType == 'core.DataEntityClassification':
+                    if not target_obj in obj.classifications:
+                        obj.addClassification(target_obj)
+                elif target_obj.classType == 'com.infa.ccgf.models.governance.BusinessTerm':
+                    if not target_obj in obj.businessterms:
+                        obj.addBusinessTerm(target_obj)
+            for parent_id in parents_of.get(identity, ()):
+                parent = loaded.get(parent_id)
+                if parent is not None:
+                    parent.addChild(obj)
+            waiting = 0
+            for child_id in children_of.get(identity, ()):
+                child = loaded.get(child_id)
+                if child is not None:
+                    obj.addChild(child)
+                if child_id not in complete:
+                    waiting += 1
+            for child_id in children_of.get(identity, ()):
+                evict_if_done(child_id)
+            if waiting == 0:
+                ready.append(obj)
+            else:
+                incomplete_children[identity] = waiting
+
+        def finish(obj):
+            identity = obj.identity
+            complete.add(identity)
+            obj.getAllRelatedPolicies()
+            obj.child_objects = ()
+            for parent_id in parents_of.get(identity, ()):
+                if parent_id in incomplete_children:
+                    incomplete_children[parent_id] -= 1
+                    if incomplete_children[parent_id] == 0:
+                        del incomplete_children[parent_id]
+                        ready.append(loaded[parent_id])
+            evict_if_done(identity)
+
+        seen_objects = set()
+        for i, query_info in enumerate(object_queries, 1):
+            if verbose:
+                print(f"  Query {i}/{len(object_queries)}: {query_info['description']} (expected ~{query_info['total']:,})")
+            first_page = query_info.pop('results', None)
+            if first_page is not None:
+                pages = [first_page]
+            else:
+                pages = self.session.elasticSearchPages({k: v for k, v in query_info['query'].items() if k not in ('from', 'size')})
+            for page in pages:
+                for result in page:
+                    try:
+                        raw_map = result['sourceAsMap']
+                        if raw_map['elementType'] != 'OBJECT' or raw_map['core.identity'] in seen_objects:
+                            continue
+                        seen_objects.add(raw_map['core.identity'])
+                        obj = INFA_DG_Object(self.session, raw_map)
+                        if origin_resource is not None:
+                            obj.setFriendlyId(origin_resource.name)
+                    except:
+                        continue
+                    load(obj)
+                    while ready:
+                        obj = ready.pop()
+                        yield obj
+                        finish(obj)
+                page = None
+
+            ## After the last query of a type: parents come first, so complete objects still in loaded
+            ## are waiting for a parent that was never fetched
+            asset_type = (query_info.get('split') or {}).get('asset_type')
+            next_asset_type = (object_queries[i].get('split') or {}).get('asset_type') if i < len(object_queries) else None
+            if asset_type is not None and asset_type != next_asset_type:
+                for identity in [identity for identity in loaded if identity in complete]:
+                    del loaded[identity]
+
+        ## Children that never arrived: complete the waiting objects bottom-up
+        for identity in list(incomplete_children):
+            incomplete_children[identity] = sum(1 for child_id in children_of.get(identity, ()) if child_id in loaded and child_id not in complete)
+        for identity, waiting in list(incomplete_children.items()):
+            if waiting == 0:
+                del incomplete_children[identity]
+                ready.append(loaded[identity])
+        while ready or incomplete_children:
+            if not ready:
+                # Cycle in the hierarchy
+                ready.append(loaded[incomplete_children.popitem()[0]])
+            obj = ready.pop()
+            yield obj
+            finish(obj)
+
+    def fetchObjectsIncremental(self, use_progressive=True, limit=None, verbose=None):
+        """
+        Bring this resource up to date from its catalog state in CATALOG_STATE_FILE, searching only
+        for the objects and relationships changed since the state's watermarks. Without a usable
+        state, or when the changes are too many to fetch unsplit, everything is fetched with fetchObjects.
+
+        Every object of the origin is rebuilt in self.objects from the state, so the hierarchy and
+        policy rollups are complete, but only the objects whose writeback may have changed are
+        returned: changed objects, sources of changed links or of links to a classification/term
+        that was renamed or whose parent policies changed, and the ancestors of all of them.
+
+        Returns:
+            (objects to write, new catalog state). Save the state with save_catalog_state() once
+            the objects have been written, so that a failed run starts again from the same watermarks.
+        """
+        if limit is None:
+            limit = PROGRESSIVE_QUERY_LIMIT
+
+        ## Taken before searching, so that anything changing while the run fetches is seen again next time
+        watermark = self.latestWatermark()
+        state = load_catalog_state(self.origin)
+        if state is None:
+            print(f"INFO: No usable catalog state for {self.name}, fetching everything")
+            return self.fetchCatalogState(watermark, use_progressive, limit, verbose)
+
+        since = {}
+        for field, value in state['watermark'].items():
+            if WATERMARK_OVERLAP and isinstance(value, (int, float)):
+                value -= WATERMARK_OVERLAP
+            since[field] = value
+        print(f"INFO: Fetching changes to {self.name} since {since}")
+        change_queries = [
+            changed_since_query([{"term": {"elementType": "OBJECT"}}, {"term": {"core.origin": self.origin}}], since),
+            changed_since_query([relationship_clause(), origin_clause(self.origin)], since)
+        ]
+
+        ## Change sets are fetched unsplit: a rescan changes everything, so fall back to a split full fetch
+        totals = [test_query(self.session, query, limit, "Changes", page_size=0)['total'] for query in change_queries]
+        if max(totals) >= limit:
+            print(f"INFO: {sum(totals):,} changes to {self.name}, fetching everything")
+            return self.fetchCatalogState(watermark, use_progressive, limit, verbose)
+        object_results, relationship_results = self.session.elasticSearchResultsMany(change_queries)
+        if len(object_results) < totals[0] or len(relationship_results) < totals[1]:
+            print(f"WARNING: Not every change to {self.name} could be fetched, fetching everything")
+            return self.fetchCatalogState(watermark, use_progressive, limit, verbose)
+        print(f"INFO: Found {len(object_results):,} objects and {len(relationship_results):,} relationships changed since then")
+
+        objects_state = state['objects']
+        children_of = state['children']
+        links_of = state['links']
+        changed = set()
+        for result in object_results:
+            try:
+                obj = INFA_DG_Object(self.session, result['sourceAsMap'])
+            except:
+                continue
+            state_map = obj.stateMap()
+            if objects_state.get(obj.identity) != state_map:
+                objects_state[obj.identity] = state_map
+                changed.add(obj.identity)
+        object_results = None
+
+        ## Documents at the watermark itself are seen again, so only what actually differs from the state
+        ## counts as a change. A link can be made by more than one relationship, so it is only removed
+        ## once no accepted relationship between the two objects is left.
+        link_types = set(RELATIONSHIP_TYPES)
+        accepted_pairs = set()
+        unaccepted_pairs = set()
+        for result in relationship_results:
+            try:
+                raw_map = result['sourceAsMap']
+                source_id = raw_map['core.sourceIdentity']
+                target_id = raw_map['core.targetIdentity']
+            except:
+                continue
+            if source_id not in objects_state:
+                continue
+            if raw_map.get('core.associationKind') == "core.ParentChild":
+                children = children_of.setdefault(source_id, [])
+                if target_id not in children:
+                    children.append(target_id)
+                    changed.add(source_id)
+                continue
+            relationship_types = raw_map.get('type', ())
+            if isinstance(relationship_types, str):
+                relationship_types = [relationship_types]
+            if link_types.isdisjoint(relationship_types):
+                continue
+            if 'ACCEPTED' in raw_map.get('core.curationStatus', ()):
+                accepted_pairs.add((source_id, target_id))
+                links = links_of.setdefault(source_id, [])
+                if target_id not in links:
+                    links.append(target_id)
+                    changed.add(source_id)
+            else:
+                unaccepted_pairs.add((source_id, target_id))
+        relationship_results = None
+
+        removed_pairs = set(pair for pair in unaccepted_pairs - accepted_pairs if pair[1] in links_of.get(pair[0], ()))
+        removed_pairs -= self.acceptedLinkPairs(removed_pairs)
+        for source_id, target_id in removed_pairs:
+            links = links_of[source_id]
+            links.remove(target_id)
+            changed.add(source_id)
+            if not links:
+                del links_of[source_id]
+
+        self.loadCatalogState(objects_state, children_of, links_of)
+
+        ## Governance objects are loaded fresh every run: objects linked to a classification/term that was
+        ## renamed or whose policies changed get new tag values
+        linked_glossary = self.linkedGlossaryState()
+        saved_glossary = state['linked_glossary']
+        stale_targets = set(target_id for target_id, target_state in linked_glossary.items() if saved_glossary.get(target_id) != target_state)
+        if stale_targets:
+            for source_id, links in links_of.items():
+                if not stale_targets.isdisjoint(links):
+                    changed.add(source_id)
+
+        ## Ancestors roll their descendants' policies up, so they are written again too
+        parents_of = {}
+        for parent_id, child_ids in children_of.items():
+            for child_id in child_ids:
+                parents_of.setdefault(child_id, []).append(parent_id)
+        affected = set()
+        stack = list(changed)
+        while stack:
+            identity = stack.pop()
+            if identity in affected or identity not in objects_state:
+                continue
+            affected.add(identity)
+            stack.extend(parents_of.get(identity, ()))
+        print(f"INFO: {len(affected):,} of {len(objects_state):,} objects of {self.name} are affected")
+
+        for field, value in state['watermark'].items():
+            watermark.setdefault(field, value)
+        new_state = catalog_state(watermark, state['full_fetch_timestamp'], objects_state, children_of, links_of, linked_glossary)
+        return [obj for obj in self.objects if obj.identity in affected], new_state
+
+    def fetchCatalogState(self, watermark, use_progressive=True, limit=None, verbose=None):
+        ## Full fetch: every object is written, and the state is rebuilt from the fetched objects
+        self.fetchObjects(use_progressive=use_progressive, limit=limit, verbose=verbose)
+        objects_state = {}
+        children_of = {}
+        links_of = {}
+        for obj in self.objects:
+            objects_state[obj.identity] = obj.stateMap()
+            if obj.child_objects:
+                children_of[obj.identity] = [child.identity for child in obj.child_objects]
+            links = [target.identity for target in obj.classifications] + [target.identity for target in obj.businessterms]
+            if links:
+                links_of[obj.identity] = links
+        new_state = catalog_state(watermark, time.time(), objects_state, children_of, links_of, self.linkedGlossaryState())
+        return list(self.objects), new_state
+
+    def acceptedLinkPairs(self, pairs, chunk_size=1000):
+        ## The (source identity, target identity) pairs of pairs still linked by an accepted
+        ## glossary/classification relationship (of RELATIONSHIP_TYPES)
+        pairs = list(pairs)
+        link_types = set(RELATIONSHIP_TYPES)
+        accepted = set()
+        for start in range(0, len(pairs), chunk_size):
+            chunk = pairs[start:start + chunk_size]
+            payload_dict = {
+                "query": {
+                    "bool": {
+                        "filter": [
+                            {"term": {"elementType": "RELATIONSHIP"}},
+                            {"terms": {"type": list(link_types)}},
+                            {"terms": {"core.sourceIdentity": sorted(set(source_id for source_id, target_id in chunk))}},
+                            {"terms": {"core.targetIdentity": sorted(set(target_id for source_id, target_id in chunk))}}
+                        ]
+                    }
+                }
+            }
+            chunk = set(chunk)
+            for result in self.session.elasticSearchResults(payload_dict):
+                try:
+                    raw_map = result['sourceAsMap']
+                    pair = (raw_map['core.sourceIdentity'], raw_map['core.targetIdentity'])
+                except:
+                    continue
+                if pair in chunk and 'ACCEPTED' in raw_map.get('core.curationStatus', ()):
+                    accepted.add(pair)
+        return accepted
+
+    def latestWatermark(self):
+        ## {field: highest value} of each WATERMARK_FIELDS field over the objects and relationships of this origin
+        watermark = {}
+        for field in WATERMARK_FIELDS:
+            payload_dict = {
+                "from": 0,
+                "size": 1,
+                "_source": {"includes": [field]},
+                "query": {
+                    "bool": {
+                        "filter": [origin_clause(self.origin)]
+                    }
+                },
+                "sort": [
+                    {field: {"order": "desc", "unmapped_type": "long"}}
+                ]
+            }
+            response = self.session.DG_elastic_search(json.dumps(payload_dict))
+            hits = response.get('hits', {}).get('hits') or []
+            value = hits[0].get('sourceAsMap', {}).get(field) if hits else None
+            if value is not None:
+                watermark[field] = value
+        return watermark
+
+    def loadCatalogState(self, objects_state, children_of, links_of):
+        ## Rebuild this origin's objects, hierarchy and classification / business term links from a catalog state
+        origin_resource = self.session.getObjectByLocationID(self.origin)
+        for state_map in objects_state.values():
+            obj = INFA_DG_Object(self.session, state_map)
+            if origin_resource is not None:
+                obj.setFriendlyId(origin_resource.name)
+            self.addObject(obj)
+            self.session.all_objects.append(obj)
+
+        by_identity = self.session.all_objects.by_identity
+        for parent_id, child_ids in children_of.items():
+            parent = by_identity.get(parent_id)
+            if parent is None:
+                continue
+            for child_id in child_ids:
+                child = by_identity.get(child_id)
+                if child is not None:
+                    parent.addChild(child)
+
+        self.session.resolveObjectsByID([target_id for links in links_of.values() for target_id in links])
+        for source_id, links in links_of.items():
+            source_obj = by_identity.get(source_id)
+            if source_obj is None:
+                continue
+            for target_id in links:
+                target_obj = by_identity.get(target_id)
+                if target_obj is None:
+                    continue
+                if target_obj.classType == 'core.DataElementClassification' or target_obj.classType == 'core.DataEntityClassification':
+                    if not target_obj in source_obj.classifications:
+                        source_obj.addClassification(target_obj)
+                elif target_obj.classType == 'com.infa.ccgf.models.governance.BusinessTerm':
+                    if not target_obj in source_obj.businessterms:
+                        source_obj.addBusinessTerm(target_obj)
+
+        self.session.relationshipsChanged()
+
+    def linkedGlossaryState(self):
+        ## {classification/business term identity: [name, sorted parent policy names]} for every one linked
+        ## to this resource's objects, i.e. everything their tag values are made of
+        linked = {}
+        for obj in self.objects:
+            for target_obj in list(obj.classifications) + list(obj.businessterms):
+                if target_obj.identity not in linked:
+                    linked[target_obj.identity] = [target_obj.name, sorted(set(policy.name for policy in target_obj.parentPolicies))]
+        return linked
+
     def getObjectsByShortType(self, shortType):
         result_array = []
         for i in self.objects:
@@ -822,37 +2121,72 @@ class INFA_DG_Object:
         return ','.join(blist)    
 
     def getFriendlyId(self):
+        if self.friendlyId is not None:
+            return self.friendlyId
         try:
             session = self.session
             originFriendlyName = session.getObjectByLocationID(self.origin).name
-            friendlyId = self.externalId.split('~')[0].replace(self.origin, originFriendlyName)
-            return friendlyId
+            self.setFriendlyId(originFriendlyName)
+            return self.friendlyId
         except:
             print("Error getting friendly name session.getObjectByLocationID("+self.origin+").name")
 
+    def setFriendlyId(self, originFriendlyName):
+        """
+        Set friendlyId (external ID with the origin replaced by its resource name) and the
+        dotted paths after the first two segments: dbPath (e.g. catalog.schema.table.column)
+        and dbParentPath (e.g. catalog.schema.table). Paths stay None for shorter IDs.
+        """
+        self.friendlyId = self.externalId.split('~')[0].replace(self.origin, originFriendlyName)
+        path_parts = self.friendlyId.split('/')[2:]
+        if len(path_parts) > 0:
+            self.dbPath = ".".join(path_parts)
+            self.dbParentPath = ".".join(path_parts[:-1])
+
     def getAllRelatedPolicies(self):
-        result_array = []
-        for obj in self.parentPolicies:
-            result_array.append(obj.name)
-        
-        for bt in self.businessterms:
-            for bt_parentpolicy in bt.parentPolicies:
-                result_array.append(bt_parentpolicy.name)
+        """
+        Sorted names of the parent policies of this object, its business terms and classifications,
+        and of everything below it in the hierarchy. Rollups are cached on each object until the
+        session's relationships change.
+        """
+        version = self.session.relationship_version
+        if self._policy_rollup_version != version:
+            self._rollupPolicies(version)
+        return sorted(self._policy_rollup)
 
+    def _ownPolicyNames(self):
+        names = set(obj.name for obj in self.parentPolicies)
+        for bt in self.businessterms:
+            names.update(bt_parentpolicy.name for bt_parentpolicy in bt.parentPolicies)
         for cl in self.classifications:
-             for cl_parentpolicy in cl.parentPolicies:
-                result_array.append(cl_parentpolicy.name)
-
-        for obj in self.child_objects:
-            child_array =  obj.getAllRelatedPolicies()
-            result_array = result_array + child_array
-
-        ## Remove duplicates
-        result_array = list(set(result_array))
-
-        return result_array
+            names.update(cl_parentpolicy.name for cl_parentpolicy in cl.parentPolicies)
+        return names
+
+    def _rollupPolicies(self, version):
+        ## Post-order walk of the hierarchy below this object: each object's rollup is its own policies
+        ## plus its children's (already computed) rollups, so every object is visited once
+        stack = [(self, False)]
+        visiting = set()
+        while stack:
+            obj, children_done = stack.pop()
+            if obj._policy_rollup_version == version:
+                continue
+            if not children_done:
+                if id(obj) in visiting:
+                    continue  # Cycle in the hierarchy
+                visiting.add(id(obj))
+                stack.append((obj, True))
+                for child in obj.child_objects:
+                    if child._policy_rollup_version != version and id(child) not in visiting:
+                        stack.append((child, False))
+                continue
+            names = obj._ownPolicyNames()
+            for child in obj.child_objects:
+                if child._policy_rollup_version == version:
+                    names.update(child._policy_rollup)
+            obj._policy_rollup = frozenset(names)
+            obj._policy_rollup_version = version
         
-
     def getParentPolicyNames(self):
         '''
         result_array = []
@@ -874,13 +2208,13 @@ class INFA_DG_Object:
         return ','.join(result_array)
 
     def __init__(self, session, raw_map ):
-        self.classifications = []
-        self.businessterms = []
-        self.objects = []
-        self.parent_objects = []
-        self.child_objects = []        
+        self.classifications = ()
+        self.businessterms = ()
+        self.objects = ()
+        self.parent_objects = ()
+        self.child_objects = ()
         self.session = session
-        self.name = raw_map['core.name']
+        self.name = intern_value(raw_map['core.name'])
         self.isResource = False
         self.isDataSet = False
         self.isDataElement = False
@@ -892,19 +2226,23 @@ class INFA_DG_Object:
                     self.isDataSet = True                    
         except:
             pass 
-        self.map = raw_map
-        self.description = ""
-        try:
-            self.description = self.getvalue('core.description')
-        except:
-            pass        
-        self.origin = self.getvalue('core.origin')
-        self.externalId = self.getvalue('core.externalId')
-        self.classType = self.getvalue('core.classType')
-        self.shortType = self.classType.split('.')[-1]
-        self.elementType = self.getvalue('elementType')
-        self.identity = self.getvalue('core.identity')
-        self.parentPolicies = []
+        if KEEP_RAW_MAPS:
+            self.map = raw_map
+        else:
+            self.map = {key: raw_map[key] for key in EXTRA_SOURCE_FIELDS if key in raw_map} or None
+        self.description = raw_map.get('core.description', "")
+        self.origin = intern_value(raw_map['core.origin'])
+        self.externalId = raw_map['core.externalId']
+        self.classType = intern_value(raw_map['core.classType'])
+        self.shortType = intern_value(self.classType.split('.')[-1])
+        self.elementType = intern_value(raw_map['elementType'])
+        self.identity = raw_map['core.identity']
+        self.parentPolicies = ()
+        self.friendlyId = None
+        self.dbPath = None
+        self.dbParentPath = None
+        self._policy_rollup = frozenset()
+        self._policy_rollup_version = -1
 
 
 
@@ -916,6 +2254,20 @@ class INFASession:
         if debugFlag:
             print(f"DEBUG: {message}")    
 
+    def create_http_session(self):
+        http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+        http.mount('https://', adapter)
+        http.mount('http://', adapter)
+        http.headers['Accept-Encoding'] = 'gzip, deflate'
+        http.headers['Connection'] = 'keep-alive'
+        return http
+
+    def http_request(self, method, url, headers=None, data=None):
+        with self.request_slots:
+            return self.http.request(method, url, headers=headers, data=data,
+                                     timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+
     def get_sessionid_and_orgid(self, username, password):
         url = self.url_base+'/identity-service/api/v1/Login'
         d = {}
@@ -928,7 +2280,7 @@ class INFASession:
 
 
         self.debug(f"idmc_api.get_sessionid_and_orgid: Running API: {url} with payload: {payload}")
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = self.http_request("POST", url, headers=headers, data=payload)
         response_data = response.json()
         session_id = response_data['sessionId']
         org_id = response_data['currentOrgId']
@@ -945,7 +2297,7 @@ class INFASession:
         headers['X-INFA-ORG-ID'] =  org_id
 
         self.debug(f"idmc_api.get_token: Running API: {url}")
-        response = requests.request("GET", url, headers=headers, data=payload)
+        response = self.http_request("GET", url, headers=headers, data=payload)
         response_data = response.json()
 
         token = response_data['jwt_token']
@@ -962,17 +2314,90 @@ class INFASession:
 
         self.debug(f"idmc_api.DG_elastic_search: About to call {url} Payload: {payload}")
 
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = self.http_request("POST", url, headers=headers, data=payload)
 
         self.debug(f"idmc_api.DG_elastic_search: Raw Response for {url}:")
         self.debug(f"{response.text}")
         return response.json()
     
-    def elasticSearchResults(self, payload_dict):
+    def elasticSearchResults(self, payload_dict, pagination_mode=None, page_size=None):
+        """
+        Run a search and return every hit, following pagination.
+
+        Args:
+            payload_dict: Elasticsearch query; its 'size' (if any) is used as the page size
+            pagination_mode: "search_after" or "offset" (default: SEARCH_PAGINATION_MODE)
+            page_size: Page size when the payload doesn't set one (default: SEARCH_PAGE_SIZE)
+        """
+        if pagination_mode is None:
+            pagination_mode = SEARCH_PAGINATION_MODE
+        if page_size is None:
+            page_size = SEARCH_PAGE_SIZE
+        size = payload_dict.get('size') or page_size
+        ## Only the projected fields are returned; every page below reuses the projected dict
+        payload_dict = with_source_filter(payload_dict)
+
+        if pagination_mode == "search_after" and payload_dict.get('from', 0) == 0 and self.search_after_available:
+            results = self._searchAfterResults(payload_dict, size)
+            if results is not None:
+                return results
+            self.debug("idmc_api.elasticSearchResults: search_after cursor not available, falling back to offset paging")
+
+        return self._offsetResults(payload_dict, size)
+
+    def _searchAfterResults(self, payload_dict, size):
+        ## Returns None if the server doesn't hand back usable cursors, so the caller can fall back
+        payload_dict = dict(payload_dict)
+        payload_dict.pop('from', None)
+        payload_dict['size'] = size
+
+        payload_dict['sort'] = sort_with_tiebreakers(payload_dict.get('sort', []))
+
+        all_results = []
+        try:
+            while True:
+                response = self.DG_elastic_search(json.dumps(payload_dict))
+
+                if 'search_after' not in payload_dict and 'hits' not in response:
+                    self.searchAfterUnavailable(f"sorted search failed: {response.get('error', response)}")
+                    return None
+                results = response['hits']['hits']
+                total_hits = response['hits']['totalHits']
+
+                all_results.extend(results)
+
+                if len(results) == 0 or len(all_results) >= total_hits:
+                    break
+
+                if 'search_after' not in payload_dict and SEARCH_WORKERS > 1 and total_hits <= SEARCH_OFFSET_WINDOW:
+                    ## Whole result fits in the offset window: the sort is deterministic, so fetch the rest in parallel
+                    all_results.extend(self._fetchOffsetPages(payload_dict, size, len(all_results), total_hits))
+                    break
+
+                cursor = results[-1].get('sortValues') or results[-1].get('sort')
+                if not cursor:
+                    self.searchAfterUnavailable("no sort values in the response")
+                    return None
+                payload_dict['search_after'] = cursor
+        except (KeyError, TypeError, ValueError) as e:
+            self.debug(f"idmc_api._searchAfterResults: unexpected response ({e})")
+            return None
+
+        if len(all_results) < total_hits:
+            return None
+
+        return all_results
+
+    def searchAfterUnavailable(self, reason):
+        ## Remembered for the session, so every later search goes straight to offset paging
+        if self.search_after_available:
+            self.search_after_available = False
+            print(f"INFO: search_after paging isn't available ({reason}), using offset paging for this session")
+
+    def _offsetResults(self, payload_dict, size):
         ## Calling multipl elastic searches to deal with pagination.
         all_results = []
         from_offset = payload_dict.get('from', 0)
-        size = payload_dict.get('size', 100)  # default page size
 
         while True:
             payload_dict['from'] = from_offset
@@ -993,7 +2418,89 @@ class INFASession:
             if total_hits_this_page == 0 or from_offset >= total_hits:
                 break
 
-        return all_results    
+            if SEARCH_WORKERS > 1:
+                all_results.extend(self._fetchOffsetPages(payload_dict, size, from_offset, total_hits))
+                break
+
+        return all_results
+
+    def _fetchOffsetPages(self, payload_dict, size, start_offset, total_hits):
+        ## Fetch the pages from start_offset to total_hits concurrently, returning hits in page order
+        def fetch_page(offset):
+            page_dict = dict(payload_dict)
+            page_dict.pop('search_after', None)
+            page_dict['from'] = offset
+            page_dict['size'] = size
+            return self.DG_elastic_search(json.dumps(page_dict))['hits']['hits']
+
+        offsets = range(start_offset, total_hits, size)
+        with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+            pages = list(executor.map(fetch_page, offsets))
+        return [hit for page in pages for hit in page]
+
+    def elasticSearchPages(self, payload_dict, page_size=None):
+        """
+        Generator version of elasticSearchResults: yields each page of hits as it arrives,
+        so callers can process a result set without holding all of it.
+        Pages follow search_after cursors (unless SEARCH_PAGINATION_MODE is "offset") and
+        continue with from/size once a page comes back without one.
+        """
+        if page_size is None:
+            page_size = SEARCH_PAGE_SIZE
+        payload_dict = dict(with_source_filter(payload_dict))
+        size = payload_dict.get('size') or page_size
+        payload_dict['size'] = size
+        use_cursor = SEARCH_PAGINATION_MODE == "search_after" and payload_dict.get('from', 0) == 0 and self.search_after_available
+        original_sort = payload_dict.get('sort')
+        if use_cursor:
+            payload_dict.pop('from', None)
+            payload_dict['sort'] = sort_with_tiebreakers(payload_dict.get('sort', []))
+        offset = payload_dict.get('from', 0)
+        fetched = 0
+
+        while True:
+            if not use_cursor:
+                payload_dict['from'] = offset + fetched
+            response = self.DG_elastic_search(json.dumps(payload_dict))
+            if use_cursor and fetched == 0 and 'hits' not in response:
+                self.searchAfterUnavailable(f"sorted search failed: {response.get('error', response)}")
+                if original_sort is None:
+                    payload_dict.pop('sort', None)
+                else:
+                    payload_dict['sort'] = original_sort
+                use_cursor = False
+                continue
+            results = response['hits']['hits']
+            total_hits = response['hits']['totalHits']
+            fetched += len(results)
+            if len(results) > 0:
+                yield results
+
+            if len(results) == 0 or offset + fetched >= total_hits:
+                return
+
+            if use_cursor:
+                cursor = results[-1].get('sortValues') or results[-1].get('sort')
+                if cursor:
+                    payload_dict['search_after'] = cursor
+                else:
+                    self.searchAfterUnavailable("no sort values in the response")
+                    payload_dict.pop('search_after', None)
+                    use_cursor = False
+
+    def elasticSearchResultsMany(self, payload_dicts, workers=None):
+        """
+        Run several independent searches concurrently.
+
+        Returns:
+            List of hit lists, in the same order as payload_dicts
+        """
+        if workers is None:
+            workers = SEARCH_WORKERS
+        if workers <= 1 or len(payload_dicts) <= 1:
+            return [self.elasticSearchResults(payload_dict) for payload_dict in payload_dicts]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.elasticSearchResults, payload_dicts))    
 
     def DG_publish(self, json_payload):
         url = self.hawk_url_base+"/ccgf-contentv2/api/v1/publish"
@@ -1006,7 +2513,7 @@ class INFASession:
         headers['Authorization'] =  'Bearer '+self.token
 
         self.debug("publish: "+json_payload)
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = self.http_request("POST", url, headers=headers, data=payload)
         return response.json()
 
     def deleteById(self, obj_identity):
@@ -1053,7 +2560,7 @@ class INFASession:
         # Try to fetch all in one query first
         test_query = {
             "from": 0,
-            "size": 0,  # Just get count
+            "size": PROBE_PAGE_SIZE,  # Count, plus the first page of hits
             "query": {
                 "term": {
                     "core.classType": class_type
@@ -1061,7 +2568,7 @@ class INFASession:
             }
         }
         
-        test_result = self.DG_elastic_search(json.dumps(test_query))
+        test_result = self.DG_elastic_search(json.dumps(with_source_filter(test_query)))
         total_count = test_result.get('hits', {}).get('totalHits', 0)
         
         if verbose:
@@ -1069,6 +2576,10 @@ class INFASession:
         
         if total_count == 0:
             return []
+
+        first_page = first_page_if_complete(test_result, total_count)
+        if first_page is not None:
+            return first_page
         
         if total_count < limit:
             # Fits in one query
@@ -1089,12 +2600,12 @@ class INFASession:
         if verbose:
             print(f"  ✗ Exceeds {limit:,} - splitting alphabetically...")
         
-        all_results = []
         alpha_ranges = [
             (None, 'a'), ('a', 'f'), ('f', 'k'), ('k', 'p'), ('p', 'u'), ('u', None)
         ]
         
-        for start, end in alpha_ranges:
+        def fetch_range(alpha_range):
+            start, end = alpha_range
             query_dict = {
                 "from": 0,
                 "size": 10000,
@@ -1116,18 +2627,22 @@ class INFASession:
             elif start and not end:
                 range_filter = {"range": {"core.name": {"gte": start.lower()}}}
             else:
-                continue
+                return []
             
             query_dict["query"]["bool"]["filter"].append(range_filter)
             
-            # Get count for this range
+            # Get count for this range, plus the first page of hits
             count_query = query_dict.copy()
-            count_query["size"] = 0
-            count_result = self.DG_elastic_search(json.dumps(count_query))
+            count_query["size"] = PROBE_PAGE_SIZE
+            count_result = self.DG_elastic_search(json.dumps(with_source_filter(count_query)))
             range_count = count_result.get('hits', {}).get('totalHits', 0)
             
             if range_count == 0:
-                continue
+                return []
+
+            first_page = first_page_if_complete(count_result, range_count)
+            if first_page is not None:
+                return first_page
             
             range_label = f"<{end}" if start is None else f"{start}-{end}" if end else f"{start}+"
             
@@ -1135,7 +2650,14 @@ class INFASession:
                 print(f"    Range [{range_label}]: {range_count:,} results")
             
             # Fetch results for this range
-            results = self.elasticSearchResults(query_dict)
+            return self.elasticSearchResults(query_dict)
+
+        # Ranges are independent, so count and fetch them concurrently (results stay in range order)
+        with ThreadPoolExecutor(max_workers=max(1, SEARCH_WORKERS)) as executor:
+            results_per_range = list(executor.map(fetch_range, alpha_ranges))
+
+        all_results = []
+        for results in results_per_range:
             all_results.extend(results)
         
         # Deduplicate by core.identity (may have duplicates due to tokenization of multi-word names)
@@ -1156,19 +2678,21 @@ class INFASession:
         return deduplicated_results
 
 
-    def fetchResources(self, use_progressive=True, verbose=None):
+    def searchClassType(self, class_type, use_progressive=True, verbose=None, size=10000):
         """
-        Fetch all resources. 
-        
+        Search every object of a class type.
+
         Args:
+            class_type: core.classType to fetch
             use_progressive: Use progressive query splitting (default True)
             verbose: Print progress messages (default: verboseSearchFlag global setting)
+            size: Page size of the single-query method
         """
         if verbose is None:
             verbose = verboseSearchFlag
         if use_progressive:
             results = self._fetchObjectsByClassType_progressive(
-                "core.Resource", 
+                class_type, 
                 limit=PROGRESSIVE_QUERY_LIMIT, 
                 verbose=verbose
             )
@@ -1176,10 +2700,10 @@ class INFASession:
             # Original single-query method
             payload_dict = {
                 "from": 0,
-                "size": 10000,
+                "size": size,
                 "query": {
                     "term": {
-                        "core.classType": "core.Resource"
+                        "core.classType": class_type
                     }
                 },
                 "sort": [
@@ -1192,103 +2716,76 @@ class INFASession:
             }
             results = self.elasticSearchResults(payload_dict)
 
-        self.debug(f"Total results from fetchResources elasticsearch: {len(results)}")
+        self.debug(f"Total results from searchClassType ({class_type}) elasticsearch: {len(results)}")
+        return results
+
+    def fetchResources(self, use_progressive=True, verbose=None):
+        """
+        Fetch all resources. 
+        
+        Args:
+            use_progressive: Use progressive query splitting (default True)
+            verbose: Print progress messages (default: verboseSearchFlag global setting)
+        """
+        self.addResources(self.searchClassType("core.Resource", use_progressive, verbose))
+        self._loaded_collections.add("resources")
 
+    def addResources(self, results):
         for obj in results:
             raw_map = obj['sourceAsMap']
             try:
                 resource = INFA_DG_Object(self, raw_map)
                 resource.isResource = True
-                self.resources.append(resource)
+                self._resources.append(resource)
             except:
                 pass
 
     def fetchClassifications(self, use_progressive=True, verbose=None):
         """
-        Fetch all classifications. 
+        Fetch all classifications and link their parent policies (fetch policies first).
         
         Args:
             use_progressive: Use progressive query splitting (default True)
             verbose: Print progress messages (default: verboseSearchFlag global setting)
         """
-        if verbose is None:
-            verbose = verboseSearchFlag
-        
         self.fetchParentPolicyOfClassifications()
+        self.addClassifications(self.searchClassType("core.DataElementClassification", use_progressive, verbose, size=1000))
+        self.addClassifications(self.searchClassType("core.DataEntityClassification", use_progressive=False, size=1000))
+        self._loaded_collections.add("classifications")
+        self.linkParentPolicies()
 
-        if use_progressive:
-            results = self._fetchObjectsByClassType_progressive(
-                "core.DataElementClassification", 
-                limit=PROGRESSIVE_QUERY_LIMIT, 
-                verbose=verbose
-            )
-        else:
-            # Original single-query method
-            payload_dict = {
-                "from": 0,
-                "size": 1000,
-                "query": {
-                    "term": {
-                        "core.classType": "core.DataElementClassification"
-                    }
-                },
-                "sort": [
-                    {
-                        "com.infa.ccgf.models.governance.scannedTime": {
-                            "order": "desc"
-                        }
-                    }
-                ]
-            }
-            results = self.elasticSearchResults(payload_dict)
-
-        self.debug(f"Total results from fetchClassifications (DataElementClassification) elasticsearch: {len(results)}")
+    def registerCollectionObjects(self, results, collection):
+        """
+        Add the objects of a governance collection search to the collection and the session. An object
+        already registered under the same identity (e.g. resolved as a link target before the collection
+        was loaded) is reused, so the objects linked to it get the collection's parent policies.
 
+        Returns:
+            The objects added to the collection
+        """
+        added = []
+        in_collection = set(id(obj) for obj in collection)
         for obj in results:
             raw_map = obj['sourceAsMap']
             try:
-                classification = INFA_DG_Object(self, raw_map)
-                classification.parentPolicies = self.fetchParentPolicyOfClassification(classification.identity)
-                self.classifications.append(classification)
-                self.all_objects.append(classification)
+                collection_obj = self.all_objects.by_identity.get(raw_map['core.identity'])
+                if collection_obj is None:
+                    collection_obj = INFA_DG_Object(self, raw_map)
+                    self.all_objects.append(collection_obj)
+                    self.missing_identities.discard(collection_obj.identity)
+                if id(collection_obj) in in_collection:
+                    continue
+                in_collection.add(id(collection_obj))
+                collection.append(collection_obj)
+                added.append(collection_obj)
             except:
                 pass
+        return added
 
+    def addClassifications(self, results):
+        self.registerCollectionObjects(results, self._classifications)
 
-        payload_dict = {
-        "from": 0,
-        "size": 1000,
-        "query": {
-            "term": {
-            "core.classType": "core.DataEntityClassification"
-            }
-        },
-        "sort": [
-            {
-            "com.infa.ccgf.models.governance.scannedTime": {
-                "order": "desc"
-            }
-            }
-        ]
-        }
-
-        results = self.elasticSearchResults(payload_dict)
-
-        self.debug(f"Total results from fetchClassifications (DataEntityClassification) elasticsearch: {len(results)}")
-
-        for obj in results:
-            raw_map = obj['sourceAsMap']
-            try:
-                classification = INFA_DG_Object(self, raw_map)
-                self.classifications.append(classification)
-                self.all_objects.append(classification)
-            except:
-                pass            
-
-    def fetchParentPolicyOfClassifications(self):
-
-        ## result_objects = []
-
+    def searchPolicyRelationships(self, relationship_type):
         payload_dict = {
         "from": 0,
         "size": 10000,
@@ -1296,7 +2793,7 @@ class INFASession:
             "bool": {
                 "filter": [
                     {"term": {"elementType": "RELATIONSHIP" }},
-                    {"term": {"type":"com.infa.ccgf.models.governance.relatedPolicyClassification" }}
+                    {"term": {"type": relationship_type }}
                 ]
             }
         },
@@ -1311,78 +2808,51 @@ class INFASession:
 
         results = self.elasticSearchResults(payload_dict)
 
-        self.debug(f"Total results from fetchParentPolicyOfClassifications elasticsearch: {len(results)}")
-
+        self.debug(f"Total results from searchPolicyRelationships ({relationship_type}) elasticsearch: {len(results)}")
+        return results
 
-        search_results = results
-        for res in search_results:
+    def addPolicyRelationships(self, results, policy_ids_by_target):
+        ## Index policy relationships as target identity -> [policy identity]
+        for res in results:
             this_source_identity = res['sourceAsMap']['core.sourceIdentity']
             this_target_identity = res['sourceAsMap']['core.targetIdentity']
-            this_relationship = {"name": this_source_identity+" "+this_target_identity, "source_identity": this_source_identity, "target_identity": this_target_identity}
-            self.all_relationships.append(this_relationship)
+            policy_ids_by_target.setdefault(this_target_identity, []).append(this_source_identity)
+
+    def fetchParentPolicyOfClassifications(self):
+        self.addPolicyRelationships(self.searchPolicyRelationships("com.infa.ccgf.models.governance.relatedPolicyClassification"),
+                                    self.classification_policy_ids)
 
+    def parentPoliciesOf(self, identity, policy_ids_by_target):
+        policies_by_identity = self._policies_by_identity
+        return [pol for policy_id in policy_ids_by_target.get(identity, ()) for pol in policies_by_identity.get(policy_id, ())]
 
     def fetchParentPolicyOfClassification(self, classification_id):
-        result_objects = []
-        for rel in self.all_relationships:
-            source_identity = rel["source_identity"]
-            target_identity = rel["target_identity"]
-            if target_identity == classification_id:
-                for pol in self.policies:
-                    if pol.identity == source_identity:
-                        self.debug(f"Adding policy {pol.name} as a parent of Classification with ID of {classification_id}")
-                        result_objects.append(pol)
-
-        return result_objects
+        self._loadCollections(["policies"])
+        return self.parentPoliciesOf(classification_id, self.classification_policy_ids)
 
     def fetchParentPolicyOfBusinessTerms(self):
+        self.addPolicyRelationships(self.searchPolicyRelationships("com.infa.ccgf.models.governance.relatedBusinessTermPolicy"),
+                                    self.business_term_policy_ids)
 
-        ## result_objects = []
-
-        payload_dict = {
-        "from": 0,
-        "size": 10000,
-        "query": {
-            "bool": {
-                "filter": [
-                    {"term": {"elementType": "RELATIONSHIP" }},
-                    {"term": {"type":"com.infa.ccgf.models.governance.relatedBusinessTermPolicy" }}
-                ]
-            }
-        },
-        "sort": [
-            {
-            "com.infa.ccgf.models.governance.scannedTime": {
-                "order": "desc"
-            }
-            }
-        ]
-        }
-
-        results = self.elasticSearchResults(payload_dict)
-
-        self.debug(f"Total results from fetchParentPolicyOfBusinessTerms elasticsearch: {len(results)}")
-
-        for res in results:
-            this_source_identity = res['sourceAsMap']['core.sourceIdentity']
-            this_target_identity = res['sourceAsMap']['core.targetIdentity']
-            this_relationship = {"name": this_source_identity+" "+this_target_identity, "source_identity": this_source_identity, "target_identity": this_target_identity}
-            self.all_relationships.append(this_relationship)
+    def fetchParentPolicyOfBusinessTerm(self, business_term_id):
+        self._loadCollections(["policies"])
+        return self.parentPoliciesOf(business_term_id, self.business_term_policy_ids)
 
+    def linkParentPolicies(self):
+        """
+        Set parentPolicies of every data element classification and business term with one
+        lookup each in the target identity -> policy indexes.
+        """
+        for classification in self._classifications:
+            if classification.classType == "core.DataElementClassification":
+                classification.parentPolicies = self.parentPoliciesOf(classification.identity, self.classification_policy_ids)
+        for term in self._businessterms:
+            term.parentPolicies = self.parentPoliciesOf(term.identity, self.business_term_policy_ids)
+        self.relationshipsChanged()
 
-    def fetchParentPolicyOfBusinessTerm(self, business_term_id):
-        
-        result_objects = []
-        for rel in self.all_relationships:
-            source_identity = rel["source_identity"]
-            target_identity = rel["target_identity"]
-            if target_identity == business_term_id:
-                for pol in self.policies:
-                    if pol.identity == source_identity:
-                        self.debug(f"Adding policy {pol.name} as a parent of Business Term with ID of {business_term_id}")
-                        result_objects.append(pol)
-
-        return result_objects
+    def relationshipsChanged(self):
+        ## Invalidates the cached policy rollups of every object
+        self.relationship_version += 1
 
     def fetchPolicies(self, use_progressive=True, verbose=None):
         """
@@ -1392,148 +2862,210 @@ class INFASession:
             use_progressive: Use progressive query splitting (default True)
             verbose: Print progress messages (default: verboseSearchFlag global setting)
         """
-        if verbose is None:
-            verbose = verboseSearchFlag
-        if use_progressive:
-            results = self._fetchObjectsByClassType_progressive(
-                "com.infa.ccgf.models.governance.Policy", 
-                limit=PROGRESSIVE_QUERY_LIMIT, 
-                verbose=verbose
-            )
-        else:
-            # Original single-query method
-            payload_dict = {
-                "from": 0,
-                "size": 10000,
-                "query": {
-                    "term": {
-                        "core.classType": "com.infa.ccgf.models.governance.Policy"
-                    }
-                },
-                "sort": [
-                    {
-                        "com.infa.ccgf.models.governance.scannedTime": {
-                            "order": "desc"
-                        }
-                    }
-                ]
-            }
-            results = self.elasticSearchResults(payload_dict)
-
-        self.debug(f"Total results from fetchPolicies elasticsearch: {len(results)}")        
+        self.addPolicies(self.searchClassType("com.infa.ccgf.models.governance.Policy", use_progressive, verbose))
+        self._loaded_collections.add("policies")
 
-        for obj in results:
-            raw_map = obj['sourceAsMap']
-            try:
-                pol = INFA_DG_Object(self, raw_map)
-                self.policies.append(pol)
-                self.all_objects.append(pol)
-            except:
-                pass
+    def addPolicies(self, results):
+        for pol in self.registerCollectionObjects(results, self._policies):
+            self._policies_by_identity.setdefault(pol.identity, []).append(pol)
 
     def fetchBusinessTerms(self, use_progressive=True, verbose=None):
         """
-        Fetch all business terms. 
+        Fetch all business terms and link their parent policies (fetch policies first).
         
         Args:
             use_progressive: Use progressive query splitting (default True)
             verbose: Print progress messages (default: verboseSearchFlag global setting)
         """
-        if verbose is None:
-            verbose = verboseSearchFlag
-        
         self.fetchParentPolicyOfBusinessTerms()
+        self.addBusinessTerms(self.searchClassType("com.infa.ccgf.models.governance.BusinessTerm", use_progressive, verbose))
+        self._loaded_collections.add("businessterms")
+        self.linkParentPolicies()
 
-        if use_progressive:
-            results = self._fetchObjectsByClassType_progressive(
-                "com.infa.ccgf.models.governance.BusinessTerm", 
-                limit=PROGRESSIVE_QUERY_LIMIT, 
-                verbose=verbose
-            )
-        else:
-            # Original single-query method
-            payload_dict = {
-                "from": 0,
-                "size": 10000,
-                "query": {
-                    "term": {
-                        "core.classType": "com.infa.ccgf.models.governance.BusinessTerm"
-                    }
-                },
-                "sort": [
-                    {
-                        "com.infa.ccgf.models.governance.scannedTime": {
-                            "order": "desc"
-                        }
-                    }
-                ]
-            }
-            results = self.elasticSearchResults(payload_dict)
-
-        self.debug(f"Total results from fetchBusinessTerms elasticsearch: {len(results)}")        
+    def addBusinessTerms(self, results):
+        self.registerCollectionObjects(results, self._businessterms)
 
-        for obj in results:
-            raw_map = obj['sourceAsMap']
-            try:
-                term = INFA_DG_Object(self, raw_map)
-                term.parentPolicies = self.fetchParentPolicyOfBusinessTerm(term.identity)
+    def bootstrap(self, collections=None, workers=None):
+        """
+        Load policies (with the policy relationships), resources, classifications and business terms.
+        The searches are independent, so they run concurrently; the results are then registered in
+        a fixed order (policies, resources, classifications, business terms) and policies linked last.
 
-                self.businessterms.append(term)
-                self.all_objects.append(term)
-            except:
-                pass
+        Args:
+            collections: Names from SESSION_COLLECTIONS to load (default: all). Loaded ones are skipped.
+            workers: Parallel searches (default: BOOTSTRAP_WORKERS)
+        """
+        if collections is None:
+            collections = SESSION_COLLECTIONS
+        if workers is None:
+            workers = BOOTSTRAP_WORKERS
+
+        with self._collections_lock:
+            collections = [c for c in SESSION_COLLECTIONS if c in collections and c not in self._loaded_collections]
+            if len(collections) == 0:
+                return
+
+            searches = []
+            if "policies" in collections:
+                searches.append(("policies", lambda: self.searchClassType("com.infa.ccgf.models.governance.Policy")))
+                searches.append(("classification_policies", lambda: self.searchPolicyRelationships("com.infa.ccgf.models.governance.relatedPolicyClassification")))
+                searches.append(("business_term_policies", lambda: self.searchPolicyRelationships("com.infa.ccgf.models.governance.relatedBusinessTermPolicy")))
+            if "resources" in collections:
+                searches.append(("resources", lambda: self.searchClassType("core.Resource")))
+            if "classifications" in collections:
+                searches.append(("element_classifications", lambda: self.searchClassType("core.DataElementClassification", size=1000)))
+                searches.append(("entity_classifications", lambda: self.searchClassType("core.DataEntityClassification", use_progressive=False, size=1000)))
+            if "businessterms" in collections:
+                searches.append(("business_terms", lambda: self.searchClassType("com.infa.ccgf.models.governance.BusinessTerm")))
+
+            labels = {"policies": "Policy", "resources": "Resource", "classifications": "Classification", "businessterms": "Business Term"}
+            print(f"INFO: Fetching {', '.join(labels[c] for c in collections)} Information")
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [(name, executor.submit(search)) for name, search in searches]
+                    results = {name: future.result() for name, future in futures}
+            else:
+                results = {name: search() for name, search in searches}
+
+            if "policies" in collections:
+                self.addPolicies(results["policies"])
+                self.addPolicyRelationships(results["classification_policies"], self.classification_policy_ids)
+                self.addPolicyRelationships(results["business_term_policies"], self.business_term_policy_ids)
+            if "resources" in collections:
+                self.addResources(results["resources"])
+            if "classifications" in collections:
+                self.addClassifications(results["element_classifications"])
+                self.addClassifications(results["entity_classifications"])
+            if "businessterms" in collections:
+                self.addBusinessTerms(results["business_terms"])
+            self._loaded_collections.update(collections)
+
+            if "policies" in self._loaded_collections:
+                self.linkParentPolicies()
+
+    def _loadCollections(self, collections):
+        if not self._loaded_collections.issuperset(collections):
+            self.bootstrap(collections)
+
+    @property
+    def policies(self):
+        self._loadCollections(["policies"])
+        return self._policies
+
+    @property
+    def resources(self):
+        self._loadCollections(["resources"])
+        return self._resources
+
+    @property
+    def classifications(self):
+        self._loadCollections(["classifications"])
+        return self._classifications
+
+    @property
+    def businessterms(self):
+        self._loadCollections(["businessterms"])
+        return self._businessterms
 
     def getObjectByID(self, identity):
 
-        for o in self.all_objects:
-            if o.identity == identity:
-                return o
+        o = self.all_objects.by_identity.get(identity)
+        if o is not None:
+            return o
 
-        payload_dict = {
-        "from": 0,
-        "size": 10000,
-        "query": {
-            "bool": {
-            "filter": [
-                {
-                "term": {
-                    "core.identity": identity
-                }
+        if identity in self.missing_identities:
+            return None
+
+        return self.resolveObjectsByID([identity]).get(identity)
+
+    def resolveObjectsByID(self, identities, batch_size=None, workers=None):
+        """
+        Fetch every identity that isn't registered yet using batched "terms" queries.
+        Objects found are registered in the session; identities that don't exist are remembered
+        so later lookups don't go back to the network. A batch whose request fails is skipped
+        (its identities stay unresolved and are looked up again next time) instead of failing
+        the whole lookup.
+
+        Args:
+            identities: Iterable of core.identity values
+            batch_size: Identities per query (default: ID_LOOKUP_BATCH_SIZE)
+            workers: Parallel requests (default: ID_LOOKUP_WORKERS)
+
+        Returns:
+            Dict of identity -> object (None if the identity doesn't exist)
+        """
+        if batch_size is None:
+            batch_size = ID_LOOKUP_BATCH_SIZE
+        if workers is None:
+            workers = ID_LOOKUP_WORKERS
+
+        identities = list(dict.fromkeys(identities))
+        unknown = [i for i in identities if i not in self.all_objects.by_identity and i not in self.missing_identities]
+
+        if len(unknown) > 0:
+            batches = [unknown[i:i + batch_size] for i in range(0, len(unknown), batch_size)]
+
+            def fetch_batch(batch):
+                payload_dict = {
+                    "from": 0,
+                    "size": len(batch),
+                    "query": {
+                        "bool": {
+                            "filter": [
+                                {"terms": {"core.identity": batch}}
+                            ]
+                        }
+                    },
+                    "sort": [
+                        {
+                            "com.infa.ccgf.models.governance.scannedTime": {
+                                "order": "desc"
+                            }
+                        }
+                    ]
                 }
-            ]
-            }
-        },
-        "sort": [
-            {
-            "com.infa.ccgf.models.governance.scannedTime": {
-                "order": "desc"
-            }
-            }
-        ]
-        }
+                try:
+                    return self.elasticSearchResults(payload_dict)
+                except Exception as e:
+                    print(f"WARNING: Lookup of {len(batch)} identities failed: {e}")
+                    failed.update(batch)
+                    return []
+
+            failed = set()
+            if workers > 1 and len(batches) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    batch_results = list(executor.map(fetch_batch, batches))
+            else:
+                batch_results = [fetch_batch(batch) for batch in batches]
 
-        results = self.elasticSearchResults(payload_dict)
+            for results in batch_results:
+                self.debug(f"Total results from resolveObjectsByID elasticsearch: {len(results)}")
+                for obj in results:
+                    try:
+                        raw_map = obj['sourceAsMap']
+                        ## Most recently scanned copy comes first
+                        if raw_map['core.identity'] in self.all_objects.by_identity:
+                            continue
+                        o = INFA_DG_Object(self, raw_map)
+                        self.all_objects.append(o)
+                    except:
+                        pass
 
-        self.debug(f"Total results from getObjectByID elasticsearch: {len(results)}")
+            for identity in unknown:
+                if identity not in self.all_objects.by_identity and identity not in failed:
+                    self.missing_identities.add(identity)
 
-        for obj in results:
-            raw_map = obj['sourceAsMap']
-            try:
-                o = INFA_DG_Object(self, raw_map)
-                self.all_objects.append(o)
-                return o
-            except:
-                pass
+        return {identity: self.all_objects.by_identity.get(identity) for identity in identities}
 
 
         
             
     def getObjectByLocationID(self, locationID):
-        for o in self.resources:
-            if o.origin == locationID and o.isResource:
-                return o
+        o = self.resources.by_origin.get(locationID)
+        if o is not None and o.isResource:
+            return o
 
-            '''
+        '''
             try:
                 location = o.map['core.location']
                 if locationID+"://"+locationID == location:
@@ -1543,30 +3075,36 @@ class INFASession:
             '''
             
     def getObjectByName(self, name):
-        for o in self.all_objects:
-            if o.name == name:
-                return o            
-
-    def __init__(self, username,password,url_base=default_infa_url_base, hawk_url_base=default_infa_hawk_url_base):
-        self.all_relationships = []
-        self.all_objects = []
-        self.businessterms = []
-        self.classifications = []
-        self.policies = []
-        self.resources = []
+        return self.all_objects.by_name.get(name)
+
+    def __init__(self, username,password,url_base=default_infa_url_base, hawk_url_base=default_infa_hawk_url_base, preload=None):
+        """
+        Args:
+            preload: Names from SESSION_COLLECTIONS to load now (default: all of them).
+                     The others are loaded the first time they're accessed.
+        """
+        ## Policy relationships: target identity -> [policy identity]
+        self.classification_policy_ids = {}
+        self.business_term_policy_ids = {}
+        self.all_objects = INFAObjectRegistry()
+        self.missing_identities = set()
+        self.search_after_available = True
+        self.relationship_version = 0
+        self._businessterms = []
+        self._classifications = []
+        self._policies = []
+        self._policies_by_identity = {}
+        self._resources = INFAObjectRegistry()
+        self._loaded_collections = set()
+        self._collections_lock = threading.RLock()
         self.url_base = url_base
         self.hawk_url_base = hawk_url_base
+        self.http = self.create_http_session()
+        self.request_slots = threading.BoundedSemaphore(HTTP_POOL_SIZE)
         self.session_id, self.org_id = self.get_sessionid_and_orgid(username, password)
         self.token = self.get_token(self.session_id, self.org_id)
         ## self.hawk_url_base = 'https://cdgc-api.dm-us.informaticacloud.com'
-        print(f"INFO: Fetching Policy Information")
-        self.fetchPolicies()
-        print(f"INFO: Fetching Resource Information")
-        self.fetchResources()
-        print(f"INFO: Fetching Classification Information")
-        self.fetchClassifications()
-        print(f"INFO: Fetching Business Term Information")
-        self.fetchBusinessTerms()
+        self.bootstrap(preload)
         
 
 
@@ -12,6 +12,9 @@ import ast
 import socket
 import requests
 import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from databricks import sql
 
 warnings.filterwarnings("ignore")
@@ -107,6 +110,43 @@ Available parameters:
         Example:
             --writeback_tags=True
 
+   --diff_against_current
+        Boolean flag to read the current tags and comments from Unity Catalog first
+        and only execute statements that actually change something.
+        Example:
+            --diff_against_current=True
+
+   --query_plan_cache_file
+        File (relative to the script location) where the catalog query plan is cached between runs.
+        Leave empty to plan from scratch on every run.
+        Example:
+            --query_plan_cache_file=query_plan_cache.json
+
+   --streaming_mode
+        Boolean flag to stream the resource instead of loading all of it first.
+        Each table's statements are executed as soon as the table and its columns have been
+        fetched, while fetching continues. Peak memory is lower than a full load on very large
+        resources, but not constant: the resource's relationship maps and the parent layer
+        (databases, schemas, tables, views waiting on their columns) are still held.
+        Example:
+            --streaming_mode=True
+
+   --incremental_sync
+        Boolean flag to only write the objects that changed since the last run.
+        The catalog state (objects, hierarchy, classification and term links, and last-modified /
+        scanned time watermarks) is saved after each run that writes every statement successfully,
+        and the next run only fetches what changed since then. The first run, runs whose last full
+        fetch is more than a week old, and runs with too many changes (e.g. after a full rescan)
+        fetch everything. Deleted assets are only picked up by those full fetches.
+        Takes precedence over streaming_mode.
+        Example:
+            --incremental_sync=True
+
+   --catalog_state_file
+        File (relative to the script location) where the catalog state is saved for incremental_sync.
+        Example:
+            --catalog_state_file=catalog_state.json
+
    --databricks_hostname
         Databricks server hostname (required if databricks_http_path specified).
         Example:
@@ -142,6 +182,18 @@ Available parameters:
         JSON list of SQL statements to execute prior to main operations.
         Example:
             --databricks_pre_statements=["SET spark.sql.shuffle.partitions=10"]
+        The statements are applied to every pooled Databricks session.
+
+   --databricks_pool_size
+        Number of Databricks sessions to open and reuse for all statements (default 4).
+        Example:
+            --databricks_pool_size=4
+
+   --databricks_workers
+        Number of tables/views written concurrently (default 4).
+        Statements for the same table or view always run in order.
+        Example:
+            --databricks_workers=8
 
    --debugFlag
         Enable debug mode with verbose output.
@@ -150,6 +202,7 @@ Available parameters:
 
    --stop_and_verify
         Pause execution for manual verification.
+        Ignored with --streaming_mode, where statements are executed as they are generated.
         Example:
             --stop_and_verify=True
 
@@ -202,6 +255,11 @@ include_url_in_table_comment = cfg.getboolean('include_url_in_table_comment')
 url_text = cfg.get('url_text')
 unset_tags_first = cfg.getboolean('unset_tags_first')
 writeback_tags = cfg.getboolean('writeback_tags')
+diff_against_current = cfg.getboolean('diff_against_current', fallback=False)
+query_plan_cache_file = cfg.get('query_plan_cache_file', fallback='')
+streaming_mode = cfg.getboolean('streaming_mode', fallback=False)
+incremental_sync = cfg.getboolean('incremental_sync', fallback=False)
+catalog_state_file = cfg.get('catalog_state_file', fallback='catalog_state.json')
 
 jdbc_url = cfg.get('jdbc_url', fallback='')
 
@@ -223,6 +281,9 @@ try:
 except json.JSONDecodeError:
     pass
 
+databricks_pool_size = cfg.getint('databricks_pool_size', fallback=4)
+databricks_workers = cfg.getint('databricks_workers', fallback=4)
+
 debugFlag = cfg.getboolean('debugFlag')
 stop_and_verify = cfg.getboolean('stop_and_verify')
 
@@ -356,21 +417,221 @@ def get_access_token():
         input("Press <ENTER> to exit...")
         sys.exit(1)
 
-def execute_statement(statement, hostname, http_path, access_token):
-    with sql.connect(
-        server_hostname=hostname,
-        http_path=http_path,
-        access_token=access_token
-    ) as connection:
-        with connection.cursor() as cursor:
-            cursor.execute(statement)
+class DatabricksConnectionPool:
+    """
+    Small pool of long-lived Databricks SQL sessions.
+
+    The first session is opened by open() and the rest lazily (up to `size`), each one gets
+    the pre-statements applied once when it is opened, and a session that drops is reopened
+    and the statement retried.
+    """
+
+    def __init__(self, hostname, http_path, access_token, size=1, pre_statements=None):
+        self.hostname = hostname
+        self.http_path = http_path
+        self.access_token = access_token
+        self.size = max(1, int(size))
+        self.pre_statements = pre_statements or []
+        self._idle = queue.Queue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        connection = sql.connect(
+            server_hostname=self.hostname,
+            http_path=self.http_path,
+            access_token=self.access_token
+        )
+        cursor = None
+        try:
+            cursor = connection.cursor()
+            for pre_statement in self.pre_statements:
+                debug(f"Executing pre-statement on new session: {pre_statement}")
+                cursor.execute(pre_statement)
+        except Exception:
+            self._discard((connection, cursor))
+            raise
+        return connection, cursor
+
+    def _discard(self, slot):
+        connection, cursor = slot
+        try:
+            cursor.close()
+        except Exception:
+            pass
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def open(self):
+        ## Opens the first session up front, so bad credentials or a failing pre-statement
+        ## stop the run before any statement is generated
+        with self._lock:
+            self._opened += 1
+        try:
+            self._release(self._open())
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+        return self
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            open_new = self._opened < self.size
+            if open_new:
+                self._opened += 1
+        if open_new:
             try:
-                return cursor.fetchall()
+                return self._open()
             except Exception:
-                # no result to fetch, e.g. for ALTER statements
-                return None
+                with self._lock:
+                    self._opened -= 1
+                raise
+        return self._idle.get()
 
-def connect_to_idmc_and_fetch_data():
+    def _release(self, slot):
+        self._idle.put(slot)
+
+    @staticmethod
+    def _run(cursor, statement):
+        cursor.execute(statement)
+        try:
+            return cursor.fetchall()
+        except Exception:
+            # no result to fetch, e.g. for ALTER statements
+            return None
+
+    # databricks.sql.exc errors raised when the session or transport is gone
+    SESSION_ERROR_TYPES = ("OperationalError", "InterfaceError", "RequestError",
+                           "SessionAlreadyClosedError", "CursorAlreadyClosedError")
+
+    @classmethod
+    def _is_session_error(cls, e):
+        # Statement errors (bad SQL, permissions, built-in catalogs...) come back as
+        # ServerOperationError and programming errors are ours, neither is retried.
+        # Only connector connection/session errors and network errors mean the session is gone.
+        message = str(e).lower()
+        if "invalid sessionhandle" in message or ("session" in message and "closed" in message):
+            return True
+        if isinstance(e, (ConnectionError, TimeoutError)):
+            return True
+        if type(e).__name__ == "ServerOperationError":
+            return False
+        return any(error_type.__name__ in cls.SESSION_ERROR_TYPES for error_type in type(e).__mro__)
+
+    def execute(self, statement):
+        slot = self._acquire()
+        try:
+            try:
+                return self._run(slot[1], statement)
+            except Exception as e:
+                if not self._is_session_error(e):
+                    raise
+                debug(f"Databricks session dropped ({e}), reconnecting")
+                self._discard(slot)
+                slot = None
+                slot = self._open()
+                return self._run(slot[1], statement)
+        finally:
+            if slot is not None:
+                self._release(slot)
+            else:
+                with self._lock:
+                    self._opened -= 1
+
+    def close(self):
+        while True:
+            try:
+                slot = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(slot)
+            with self._lock:
+                self._opened -= 1
+
+def execute_statement(statement, pool):
+    return pool.execute(statement)
+
+statement_target_pattern = re.compile(r"^\s*(?:alter|comment\s+on)\s+(?:table|view)\s+(\S+)", re.IGNORECASE)
+
+def statement_target(statement):
+    # The table or view a statement writes to; column statements resolve to their table
+    match = statement_target_pattern.match(statement)
+    if match:
+        return match.group(1).lower()
+    return statement
+
+def group_statements_by_target(statement_entries):
+    ## Keeps the original order within each table/view, e.g. unsets before sets
+    groups = {}
+    for statement, announce in statement_entries:
+        groups.setdefault(statement_target(statement), []).append((statement, announce))
+    return list(groups.values())
+
+def execute_statement_group(statement_group, pool):
+    ## Returns the number of statements that failed (built-in catalog refusals aren't failures)
+    failed_count = 0
+    for statement, announce in statement_group:
+        if announce:
+            print("INFO: Executing " + statement)
+        try:
+            execute_statement(statement, pool)
+        except Exception as e:
+            message = str(e)
+            if "built-in catalogs" in message:
+                pass
+            else:
+                failed_count += 1
+                debug(f"Statement failed: {statement}: {message}")
+    return failed_count
+
+def execute_statement_groups(statement_groups, pool, workers=1):
+    with ThreadPoolExecutor(max_workers=max(1, int(workers))) as executor:
+        futures = [executor.submit(execute_statement_group, group, pool) for group in statement_groups]
+        return sum(future.result() for future in futures)
+
+sql_escape_sequences = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a', '%': '\\%', '_': '\\_'}
+
+def unescape_sql_string(literal):
+    # The value Databricks stores for the contents of a '...' string literal (Spark SQL backslash escapes)
+    return re.sub(r"\\(.)", lambda match: sql_escape_sequences.get(match.group(1), match.group(1)), literal, flags=re.DOTALL)
+
+def object_location(obj, obj_parent_path, obj_name):
+    # (table or view path, column name or None) that a statement for this object writes to
+    if obj.shortType.endswith('Column'):
+        return obj_parent_path, obj_name
+    return f"{obj_parent_path}.{obj_name}", None
+
+def record_change(statement, kind, location, value, statement_prefix=None):
+    ## Remembers what a statement writes, so diff mode can compare it with the current state
+    planned_changes[statement] = {"kind": kind, "table": location[0], "column": location[1],
+                                  "value": value, "prefix": statement_prefix}
+
+def alter_statement_prefix(obj, obj_parent_path, obj_name):
+    # The "ALTER ..." part shared by every tag statement for this object, or None if tags don't apply
+    if obj.shortType.endswith('ViewColumn'):
+        return f"ALTER VIEW {obj_parent_path} ALTER Column {obj_name}"
+    elif obj.shortType.endswith('Column'):
+        return f"ALTER TABLE {obj_parent_path} ALTER Column {obj_name}"
+    elif obj.shortType.endswith('Table'):
+        return f"ALTER TABLE {obj_parent_path}.{obj_name}"
+    elif obj.shortType.endswith('View'):
+        return f"ALTER VIEW {obj_parent_path}.{obj_name}"
+    return None
+
+def format_tag_names(tag_names):
+    return ", ".join(f"'{tag_name}'" for tag_name in tag_names)
+
+def format_tag_assignments(tags):
+    return ", ".join(f"'{tag_name}' = '{tag_value}'" for tag_name, tag_value in tags.items())
+
+def connect_to_idmc():
     global catalog_pass
 
     print(f"INFO: Connecting to Catalog as user {catalog_user}, and fetching some basic information")
@@ -389,13 +650,29 @@ def connect_to_idmc_and_fetch_data():
 
     infaLog(f"User: {catalog_user}, URL: {url_base}, Version: {version}")
 
+    if query_plan_cache_file:
+        idmc_api.QUERY_PLAN_CACHE_FILE = os.path.join(script_location, query_plan_cache_file)
+    if incremental_sync and catalog_state_file:
+        idmc_api.CATALOG_STATE_FILE = os.path.join(script_location, catalog_state_file)
+
+    ## Only load the governance collections the enabled writebacks use
+    preload = ['resources']
+    if writeback_classification:
+        preload.append('classifications')
+    if writeback_business_term:
+        preload.append('businessterms')
+    if writeback_parent_policy:
+        preload.extend(['policies', 'classifications', 'businessterms'])
+
     session = idmc_api.INFASession(username=catalog_user, password=catalog_pass, url_base=url_base,
-                                   hawk_url_base=hawk_url_base)
+                                   hawk_url_base=hawk_url_base, preload=preload)
 
-    global statements, unset_statements, unset_tags
+    global statements, unset_statements, unset_tags, planned_changes, pending_catalog_state
     statements = []
     unset_statements = []
     unset_tags = []
+    planned_changes = {}
+    pending_catalog_state = None
 
     if unset_tags_first:
         if writeback_business_term:
@@ -405,131 +682,199 @@ def connect_to_idmc_and_fetch_data():
         if writeback_classification:
             unset_tags.append(writeback_classification_tag)
 
+    return session
+
+def connect_to_idmc_and_fetch_data():
+    global pending_catalog_state
+    session = connect_to_idmc()
+
     for r in session.resources:
         if r.name == catalog_resource_name:
-            r.fetchObjects()
+            if incremental_sync and idmc_api.CATALOG_STATE_FILE:
+                objects_to_write, catalog_state = r.fetchObjectsIncremental()
+                pending_catalog_state = (r.origin, catalog_state)
+            else:
+                r.fetchObjects()
+                objects_to_write = r.objects
             print(f"INFO: Evaluating {catalog_resource_name}")
-            for obj in r.objects:
-                try:
-                    debug(f"Looking at path: {obj.getFriendlyId()}")
-                    db_path_array = obj.getFriendlyId().split('/')
-                    db_path_array.pop(0)
-                    db_path_array.pop(0)
-                    obj_path = ".".join(db_path_array)
-                    db_path_array.pop(-1)
-                    obj_parent_path = ".".join(db_path_array)
-                    obj_name = obj.name
-                except:
-                    continue
-
-                debug(f"Evaluating: {obj.shortType} {obj_parent_path}.{obj_name}")
-                debug(f"     Classifications: {obj.getClassificationNames()}")
-                debug(f"     Business Terms: {obj.getBusinessTermNames()}")
-
-                if unset_tags_first:
-                    for unset_tag in unset_tags:
-                        if obj.shortType.endswith('ViewColumn'):
-                            unset_statement = f"ALTER VIEW {obj_parent_path} ALTER Column {obj_name} UNSET tags ( '{unset_tag}' )"
-                            unset_statements.append(unset_statement)
-                            debug(f"Adding unset statement: {unset_statement}")
-                        elif obj.shortType.endswith('Column'):
-                            unset_statement = f"ALTER TABLE {obj_parent_path} ALTER Column {obj_name} UNSET tags ( '{unset_tag}' )"
-                            unset_statements.append(unset_statement)
-                            debug(f"Adding unset statement: {unset_statement}")
-                        elif obj.shortType.endswith('Table'):
-                            unset_statement = f"ALTER TABLE {obj_parent_path}.{obj_name} UNSET tags ( '{unset_tag}' )"
-                            unset_statements.append(unset_statement)
-                            debug(f"Adding unset statement: {unset_statement}")
-                        elif obj.shortType.endswith('View'):
-                            unset_statement = f"ALTER VIEW {obj_parent_path}.{obj_name} UNSET tags ( '{unset_tag}' )"
-                            unset_statements.append(unset_statement)
-                            debug(f"Adding unset statement: {unset_statement}")
-
-                if len(obj.getBusinessTermNames()) > 0 and writeback_business_term:
-                    if obj.shortType.endswith('ViewColumn'):
-                        statement = f"ALTER VIEW {obj_parent_path} ALTER Column {obj_name} SET tags ( '{writeback_business_term_tag}' = '{obj.getBusinessTermNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('Column'):
-                        statement = f"ALTER TABLE {obj_parent_path} ALTER Column {obj_name} SET tags ( '{writeback_business_term_tag}' = '{obj.getBusinessTermNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('Table'):
-                        statement = f"ALTER TABLE {obj_parent_path}.{obj_name} SET tags ( '{writeback_business_term_tag}' = '{obj.getBusinessTermNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('View'):
-                        statement = f"ALTER VIEW {obj_parent_path}.{obj_name} SET tags ( '{writeback_business_term_tag}' = '{obj.getBusinessTermNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-
-                if len(obj.getParentPolicyNames()) > 1 and writeback_parent_policy:
-                    if obj.shortType.endswith('ViewColumn'):
-                        statement = f"ALTER VIEW {obj_parent_path} ALTER Column {obj_name} SET tags ( '{writeback_parent_policy_tag}' = '{obj.getParentPolicyNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('Column'):
-                        statement = f"ALTER TABLE {obj_parent_path} ALTER Column {obj_name} SET tags ( '{writeback_parent_policy_tag}' = '{obj.getParentPolicyNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('Table'):
-                        statement = f"ALTER TABLE {obj_parent_path}.{obj_name} SET tags ( '{writeback_parent_policy_tag}' = '{obj.getParentPolicyNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('View'):
-                        statement = f"ALTER VIEW {obj_parent_path}.{obj_name} SET tags ( '{writeback_parent_policy_tag}' = '{obj.getParentPolicyNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-
-                if len(obj.getClassificationNames()) > 0 and writeback_classification:
-                    if obj.shortType.endswith('ViewColumn'):
-                        statement = f"ALTER VIEW {obj_parent_path} ALTER Column {obj_name} SET tags ( '{writeback_classification_tag}' = '{obj.getClassificationNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('Column'):
-                        statement = f"ALTER TABLE {obj_parent_path} ALTER Column {obj_name} SET tags ( '{writeback_classification_tag}' = '{obj.getClassificationNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('Table'):
-                        statement = f"ALTER TABLE {obj_parent_path}.{obj_name} SET tags ( '{writeback_classification_tag}' = '{obj.getClassificationNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('View'):
-                        statement = f"ALTER VIEW {obj_parent_path}.{obj_name} SET tags ( '{writeback_classification_tag}' = '{obj.getClassificationNames()}' )"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-
-                if writeback_comment:
-                    if obj.shortType.endswith('ViewColumn') and (len(obj.description) > 2 or include_url_in_table_comment):
-                        description_1 = re.sub('<[^<]+?>', '', obj.description)
-                        description_2 = description_1.replace("'", "\\'")
-                        statement = f"alter view {obj_parent_path} alter column {obj_name} comment '{description_2}'"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('Column') and len(obj.description) > 2:
-                        description_1 = re.sub('<[^<]+?>', '', obj.description)
-                        description_2 = description_1.replace("'", "\\'")
-                        statement = f"alter table {obj_parent_path} alter column {obj_name} comment '{description_2}'"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('View') and (len(obj.description) > 2 or include_url_in_table_comment):
-                        description_1 = re.sub('<[^<]+?>', '', obj.description)
-                        description_2 = description_1.replace("'", "\\'")
-                        if include_url_in_table_comment:
-                            description_2 = f"{description_2}   ([{url_text}]({asset_url_base}/{obj.identity}))"
-                        statement = f"COMMENT ON VIEW {obj_parent_path}.{obj_name} is '{description_2}'"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
-                    elif obj.shortType.endswith('Table') and (len(obj.description) > 2 or include_url_in_table_comment):
-                        description_1 = re.sub('<[^<]+?>', '', obj.description)
-                        description_2 = description_1.replace("'", "\\'")
-                        if include_url_in_table_comment:
-                            description_2 = f"{description_2}   ([{url_text}]({asset_url_base}/{obj.identity}))"
-                        statement = f"COMMENT ON TABLE {obj_parent_path}.{obj_name} is '{description_2}'"
-                        statements.append(statement)
-                        print(f"INFO: Adding {statement}")
+            for obj in objects_to_write:
+                object_unset_statements, object_statements = plan_object_statements(obj)
+                unset_statements.extend(object_unset_statements)
+                statements.extend(object_statements)
+
+def plan_object_statements(obj):
+    ## (unset statements, other statements) for one catalog object, each recorded in planned_changes
+    object_unset_statements = []
+    object_statements = []
+
+    ## Paths are resolved once when the objects are fetched
+    if obj.dbParentPath is None:
+        return object_unset_statements, object_statements
+    debug(f"Looking at path: {obj.friendlyId}")
+    obj_parent_path = obj.dbParentPath
+    obj_name = obj.name
+
+    debug(f"Evaluating: {obj.shortType} {obj_parent_path}.{obj_name}")
+    debug(f"     Classifications: {obj.getClassificationNames()}")
+    debug(f"     Business Terms: {obj.getBusinessTermNames()}")
+
+    location = object_location(obj, obj_parent_path, obj_name)
+    statement_prefix = alter_statement_prefix(obj, obj_parent_path, obj_name)
+    if statement_prefix is not None:
+        tags_to_set = {}
+        if len(obj.getBusinessTermNames()) > 0 and writeback_business_term:
+            tags_to_set[writeback_business_term_tag] = obj.getBusinessTermNames()
+        if writeback_parent_policy:
+            parent_policy_names = obj.getParentPolicyNames()
+            if len(parent_policy_names) > 1:
+                tags_to_set[writeback_parent_policy_tag] = parent_policy_names
+        if len(obj.getClassificationNames()) > 0 and writeback_classification:
+            tags_to_set[writeback_classification_tag] = obj.getClassificationNames()
+
+        ## SET overwrites an existing value, so only unset the managed tags that won't get a new one.
+        ## SETs are only executed with writeback_tags, otherwise every managed tag is unset.
+        if writeback_tags:
+            tags_to_unset = [t for t in unset_tags if t not in tags_to_set]
+        else:
+            tags_to_unset = list(unset_tags)
+        if unset_tags_first and len(tags_to_unset) > 0:
+            unset_statement = f"{statement_prefix} UNSET tags ( {format_tag_names(tags_to_unset)} )"
+            object_unset_statements.append(unset_statement)
+            record_change(unset_statement, "unset_tags", location, tags_to_unset, statement_prefix)
+            debug(f"Adding unset statement: {unset_statement}")
+
+        if len(tags_to_set) > 0:
+            statement = f"{statement_prefix} SET tags ( {format_tag_assignments(tags_to_set)} )"
+            object_statements.append(statement)
+            record_change(statement, "set_tags", location, tags_to_set, statement_prefix)
+            print(f"INFO: Adding {statement}")
+
+    if writeback_comment:
+        if obj.shortType.endswith('ViewColumn') and (len(obj.description) > 2 or include_url_in_table_comment):
+            description_1 = re.sub('<[^<]+?>', '', obj.description)
+            description_2 = description_1.replace("'", "\\'")
+            statement = f"alter view {obj_parent_path} alter column {obj_name} comment '{description_2}'"
+            object_statements.append(statement)
+            record_change(statement, "comment", location, unescape_sql_string(description_2))
+            print(f"INFO: Adding {statement}")
+        elif obj.shortType.endswith('Column') and len(obj.description) > 2:
+            description_1 = re.sub('<[^<]+?>', '', obj.description)
+            description_2 = description_1.replace("'", "\\'")
+            statement = f"alter table {obj_parent_path} alter column {obj_name} comment '{description_2}'"
+            object_statements.append(statement)
+            record_change(statement, "comment", location, unescape_sql_string(description_2))
+            print(f"INFO: Adding {statement}")
+        elif obj.shortType.endswith('View') and (len(obj.description) > 2 or include_url_in_table_comment):
+            description_1 = re.sub('<[^<]+?>', '', obj.description)
+            description_2 = description_1.replace("'", "\\'")
+            if include_url_in_table_comment:
+                description_2 = f"{description_2}   ([{url_text}]({asset_url_base}/{obj.identity}))"
+            statement = f"COMMENT ON VIEW {obj_parent_path}.{obj_name} is '{description_2}'"
+            object_statements.append(statement)
+            record_change(statement, "comment", location, unescape_sql_string(description_2))
+            print(f"INFO: Adding {statement}")
+        elif obj.shortType.endswith('Table') and (len(obj.description) > 2 or include_url_in_table_comment):
+            description_1 = re.sub('<[^<]+?>', '', obj.description)
+            description_2 = description_1.replace("'", "\\'")
+            if include_url_in_table_comment:
+                description_2 = f"{description_2}   ([{url_text}]({asset_url_base}/{obj.identity}))"
+            statement = f"COMMENT ON TABLE {obj_parent_path}.{obj_name} is '{description_2}'"
+            object_statements.append(statement)
+            record_change(statement, "comment", location, unescape_sql_string(description_2))
+            print(f"INFO: Adding {statement}")
+
+    return object_unset_statements, object_statements
+
+class DatabricksState:
+    """
+    Current Unity Catalog tags and comments, bulk-read from information_schema
+    (a handful of queries per catalog) the first time a catalog is needed.
+    """
+
+    def __init__(self, pool, tag_names):
+        self.pool = pool
+        self.tag_names = list(tag_names)
+        self.tags = {}
+        self.comments = {}
+        self.loaded_catalogs = set()
+        self.unavailable_catalogs = set()
+
+    @staticmethod
+    def key(table, column=None):
+        table = table.replace('`', '').lower()
+        if column is None:
+            return (table, None)
+        return (table, column.replace('`', '').lower())
+
+    def ensure_catalog(self, catalog):
+        catalog = catalog.replace('`', '').lower()
+        if catalog in self.loaded_catalogs:
+            return True
+        if catalog in self.unavailable_catalogs:
+            return False
+
+        schema = f"`{catalog}`.information_schema"
+        tag_filter = ""
+        if len(self.tag_names) > 0:
+            tag_filter = " WHERE tag_name IN (" + format_tag_names(self.tag_names) + ")"
+        try:
+            print(f"INFO: Reading current tags and comments for catalog {catalog}")
+            for row in execute_statement(f"SELECT catalog_name, schema_name, table_name, tag_name, tag_value FROM {schema}.table_tags{tag_filter}", self.pool) or []:
+                self.tags.setdefault(self.key(f"{row[0]}.{row[1]}.{row[2]}"), {})[row[3]] = row[4]
+            for row in execute_statement(f"SELECT catalog_name, schema_name, table_name, column_name, tag_name, tag_value FROM {schema}.column_tags{tag_filter}", self.pool) or []:
+                self.tags.setdefault(self.key(f"{row[0]}.{row[1]}.{row[2]}", row[3]), {})[row[4]] = row[5]
+            for row in execute_statement(f"SELECT table_catalog, table_schema, table_name, comment FROM {schema}.tables", self.pool) or []:
+                self.comments[self.key(f"{row[0]}.{row[1]}.{row[2]}")] = row[3]
+            for row in execute_statement(f"SELECT table_catalog, table_schema, table_name, column_name, comment FROM {schema}.columns", self.pool) or []:
+                self.comments[self.key(f"{row[0]}.{row[1]}.{row[2]}", row[3])] = row[4]
+        except Exception as e:
+            print(f"WARNING: Could not read current state of catalog {catalog}, its statements will all be executed: {e}")
+            self.unavailable_catalogs.add(catalog)
+            return False
 
-def connect_to_databricks_and_update():
+        self.loaded_catalogs.add(catalog)
+        return True
+
+    def reduce(self, statement, change):
+        """Returns the statement (possibly narrowed) needed to reach the planned state, or None if nothing changes"""
+        if not self.ensure_catalog(change["table"].split('.')[0]):
+            return statement
+
+        key = self.key(change["table"], change["column"])
+        current_tags = self.tags.get(key, {})
+
+        if change["kind"] == "set_tags":
+            changed = {k: v for k, v in change["value"].items() if current_tags.get(k) != v}
+            if len(changed) == 0:
+                return None
+            if len(changed) == len(change["value"]):
+                return statement
+            return f"{change['prefix']} SET tags ( {format_tag_assignments(changed)} )"
+        elif change["kind"] == "unset_tags":
+            present = [t for t in change["value"] if t in current_tags]
+            if len(present) == 0:
+                return None
+            if len(present) == len(change["value"]):
+                return statement
+            return f"{change['prefix']} UNSET tags ( {format_tag_names(present)} )"
+        elif change["kind"] == "comment":
+            if (self.comments.get(key) or "") == change["value"]:
+                return None
+        return statement
+
+def diff_statement_entries(statement_entries, state):
+    result = []
+    for statement, announce in statement_entries:
+        change = planned_changes.get(statement)
+        if change is not None:
+            statement = state.reduce(statement, change)
+            if statement is None:
+                debug(f"Already up to date: {change['table']} {change['column'] or ''} ({change['kind']})")
+                continue
+        result.append((statement, announce))
+    return result
+
+def announce_databricks_plan(verify=True):
     if unset_tags_first:
         print(f"INFO: Will unset Tags")
     else:
@@ -539,35 +884,151 @@ def connect_to_databricks_and_update():
     else:
         print(f"INFO: Will NOT update Tags")
     if stop_and_verify:
-        input("Press any key to continue...")
+        if verify:
+            input("Press any key to continue...")
+        else:
+            ## Nothing is planned yet when streaming, so there's nothing to verify before it runs
+            print(f"WARNING: stop_and_verify is ignored in streaming_mode: statements are executed as they are generated")
 
+def open_databricks_pool():
     hostname_to_use, http_path_to_use = build_hostname_and_http_path()
     access_token = get_access_token()
 
-    print("INFO: Executing pre-statements")
-    for pre_statement in databricks_pre_statements:
-        execute_statement(pre_statement, hostname_to_use, http_path_to_use, access_token)
+    pool_size = max(databricks_pool_size, databricks_workers)
+    print(f"INFO: Opening a Databricks session (up to {pool_size}, opened as needed), applying {len(databricks_pre_statements)} pre-statement(s) to each")
+    pool = DatabricksConnectionPool(hostname_to_use, http_path_to_use, access_token,
+                                    size=pool_size, pre_statements=databricks_pre_statements)
+    return pool.open()
 
+def statement_entries_for(unset_statement_list, statement_list):
+    ## (statement, announce) entries to execute, unsets first
+    statement_entries = []
     if unset_tags_first:
-        print(f"INFO: Executing statements to unset these tags: {','.join(unset_tags)}")
-        for unset_statement in unset_statements:
-            try:
-                execute_statement(unset_statement, hostname_to_use, http_path_to_use, access_token)
-            except Exception as e:
-                message = str(e)
-                if "built-in catalogs" in message:
-                    pass
-
+        statement_entries.extend((unset_statement, False) for unset_statement in unset_statement_list)
     if writeback_tags:
-        for statement in statements:
-            print("INFO: Executing " + statement)
-            try:
-                execute_statement(statement, hostname_to_use, http_path_to_use, access_token)
-            except Exception as e:
-                message = str(e)
-                if "built-in catalogs" in message:
-                    pass
+        statement_entries.extend((statement, True) for statement in statement_list)
+    return statement_entries
 
+def current_databricks_state(pool):
+    return DatabricksState(pool, [t for t in [writeback_business_term_tag, writeback_parent_policy_tag, writeback_classification_tag] if t])
+
+def connect_to_databricks_and_update():
+    announce_databricks_plan()
+    pool = open_databricks_pool()
+
+    try:
+        if unset_tags_first:
+            print(f"INFO: Executing statements to unset these tags: {','.join(unset_tags)}")
+        statement_entries = statement_entries_for(unset_statements, statements)
+
+        if diff_against_current:
+            state = current_databricks_state(pool)
+            planned_count = len(statement_entries)
+            statement_entries = diff_statement_entries(statement_entries, state)
+            print(f"INFO: Diff mode: {len(statement_entries)} of {planned_count} statements change something")
+
+        statement_groups = group_statements_by_target(statement_entries)
+        print(f"INFO: Executing {len(statement_entries)} statements across {len(statement_groups)} tables/views with {databricks_workers} worker(s)")
+
+        failed_count = execute_statement_groups(statement_groups, pool, workers=databricks_workers)
+    finally:
+        pool.close()
+
+    if failed_count > 0:
+        print(f"WARNING: {failed_count} statements failed (set debugFlag = True to see them)")
+    return failed_count
+
+def save_catalog_state(failed_count=0):
+    ## Only once every change has been written, so that a failed or dry run is fetched again next time
+    if pending_catalog_state is None:
+        return
+    if not writeback_tags:
+        print(f"INFO: Tags weren't written, catalog state not saved")
+        return
+    if failed_count > 0:
+        print(f"INFO: {failed_count} statements failed, catalog state not saved (the next run fetches the same changes again)")
+        return
+    origin, catalog_state = pending_catalog_state
+    idmc_api.save_catalog_state(origin, catalog_state)
+    print(f"INFO: Saved catalog state (watermarks {catalog_state['watermark']}) to {idmc_api.CATALOG_STATE_FILE}")
+
+def stream_idmc_to_databricks():
+    ## Streaming mode: a table's statements are executed once the table and all of its columns
+    ## have been fetched, while the rest of the resource is still being fetched
+    session = connect_to_idmc()
+    announce_databricks_plan(verify=False)
+    pool = open_databricks_pool()
+
+    workers = max(1, int(databricks_workers))
+    ## Bounds how many table groups wait for a worker, so fetching can't run far ahead of Databricks
+    queue_slots = threading.BoundedSemaphore(workers * 4)
+    pending_groups = {}
+    ## Only unfinished futures are kept (their errors are raised when they are collected)
+    futures = set()
+    group_count = 0
+    failed_count = 0
+    planned_count = 0
+    executed_count = 0
+
+    def collect_finished():
+        nonlocal failed_count
+        for future in [f for f in futures if f.done()]:
+            futures.discard(future)
+            failed_count += future.result()
+
+    def submit(executor, statement_group):
+        nonlocal group_count
+        queue_slots.acquire()
+        collect_finished()
+        future = executor.submit(execute_statement_group, statement_group, pool)
+        future.add_done_callback(lambda f: queue_slots.release())
+        futures.add(future)
+        group_count += 1
+
+    def wait_for_submitted():
+        nonlocal failed_count
+        while futures:
+            failed_count += futures.pop().result()
+
+    try:
+        state = current_databricks_state(pool) if diff_against_current else None
+        if unset_tags_first:
+            print(f"INFO: Executing statements to unset these tags: {','.join(unset_tags)}")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for r in session.resources:
+                if r.name == catalog_resource_name:
+                    print(f"INFO: Evaluating {catalog_resource_name} (streaming)")
+                    for obj in r.streamObjects():
+                        object_unset_statements, object_statements = plan_object_statements(obj)
+                        statement_entries = statement_entries_for(object_unset_statements, object_statements)
+                        planned_count += len(statement_entries)
+                        if state is not None:
+                            statement_entries = diff_statement_entries(statement_entries, state)
+                        for statement in object_unset_statements + object_statements:
+                            planned_changes.pop(statement, None)
+                        executed_count += len(statement_entries)
+                        for statement, announce in statement_entries:
+                            pending_groups.setdefault(statement_target(statement), []).append((statement, announce))
+
+                        ## Objects come after everything below them, so a table's group is complete now
+                        if obj.dbParentPath is not None:
+                            statement_group = pending_groups.pop(f"{obj.dbParentPath}.{obj.name}".lower(), None)
+                            if statement_group:
+                                submit(executor, statement_group)
+
+            ## Statements of tables/views that never completed, once the earlier groups are done
+            wait_for_submitted()
+            for statement_group in pending_groups.values():
+                submit(executor, statement_group)
+            wait_for_submitted()
+    finally:
+        pool.close()
+
+    if state is not None:
+        print(f"INFO: Diff mode: {executed_count} of {planned_count} statements changed something")
+    print(f"INFO: Executed {executed_count} statements across {group_count} tables/views with {workers} worker(s)")
+    if failed_count > 0:
+        print(f"WARNING: {failed_count} statements failed (set debugFlag = True to see them)")
 
 
 if __name__ == "__main__":
@@ -577,12 +1038,18 @@ if __name__ == "__main__":
         'catalog_user', 'catalog_pass', 'encrypted_catalog_pass', 'idmc_pod', 'catalog_resource_name',
         'writeback_business_term', 'writeback_business_term_tag', 'writeback_parent_policy', 'writeback_parent_policy_tag',
         'writeback_classification', 'writeback_classification_tag', 'writeback_comment', 'include_url_in_table_comment',
-        'url_text', 'unset_tags_first', 'writeback_tags', 'databricks_hostname', 'databricks_port', 'databricks_http_path',
-        'token_name', 'token_value', 'encrypted_token_value', 'databricks_pre_statements', 'debugFlag', 'stop_and_verify'
+        'url_text', 'unset_tags_first', 'writeback_tags', 'diff_against_current', 'query_plan_cache_file', 'streaming_mode', 'incremental_sync', 'catalog_state_file', 'databricks_hostname', 'databricks_port', 'databricks_http_path',
+        'token_name', 'token_value', 'encrypted_token_value', 'databricks_pre_statements', 'databricks_pool_size', 'databricks_workers', 'debugFlag', 'stop_and_verify'
     ]:
         debug(f"    {var_name} = {repr(eval(var_name))}")
 
-    connect_to_idmc_and_fetch_data()
-    connect_to_databricks_and_update()
+    if streaming_mode and incremental_sync:
+        print(f"INFO: incremental_sync is enabled, streaming_mode is ignored")
+    if streaming_mode and not incremental_sync:
+        stream_idmc_to_databricks()
+    else:
+        connect_to_idmc_and_fetch_data()
+        failed_count = connect_to_databricks_and_update()
+        save_catalog_state(failed_count)
     input("Press the <ENTER> key to exit...")
     sys.exit(0)